@@ -19,7 +19,7 @@ class App:
         self.screen = pygame.display.set_mode(C.WINDOW_SIZE)
         pygame.display.set_caption(C.TITLE)
 
-        self.clock = GameClock(C.FPS)
+        self.clock = GameClock(C.FPS, 1 / C.SIM_HZ, C.MAX_STEPS)
         self.bus = EventBus()
         self.assets = ResourceManager()
         self.audio = AudioManager(self.assets)
@@ -35,6 +35,7 @@ class App:
             "input": self.input,
             "physics": self.physics,
             "save": self.save,
+            "clock": self.clock,
         }
         self.scenes.register("menu", MenuScene(self.scenes, services))
         self.scenes.register("game", GameScene(self.scenes, services))
@@ -42,20 +43,22 @@ class App:
         self.scenes.register("game_over", GameOverScene(self.scenes, services))
         self.scenes.change("menu")
         self.running = True
+        self._presented = None   # сцена, чий кадр зараз на екрані
 
     def run(self):
         while self.running:
             try:
-                dt = self.clock.tick()
+                self.clock.tick()
                 for e in pygame.event.get():
                     if e.type == pygame.QUIT:
                         self.running = False
                     else:
                         self.scenes.current.handle_event(e)
 
-                self.scenes.current.update(dt)
-                self.scenes.current.draw(self.screen)
-                pygame.display.flip()
+                # фіксований крок: 0..MAX_STEPS оновлень за кадр, рендер інтерполює між ними (clock.alpha)
+                for _ in range(self.clock.steps()):
+                    self.scenes.current.update(self.clock.step)
+                self.present()
             except Exception as ex:
                 print("\n=== Uncaught exception in main loop ===")
                 traceback.print_exc()
@@ -64,3 +67,22 @@ class App:
                 self.running = False
 
         pygame.quit()
+
+    def present(self):
+        """
+        Перший кадр сцени (і після pop паузи) — повний draw + flip. Далі, якщо сцена має draw_dirty,
+        на дисплей ідуть лише змінені прямокутники; коли їх площа завелика — один flip.
+        """
+        scene = self.scenes.current
+        draw_dirty = getattr(scene, "draw_dirty", None)
+        if not (C.DIRTY_RENDERING and draw_dirty and scene is self._presented):
+            self._presented = scene
+            scene.draw(self.screen)
+            pygame.display.flip()
+            return
+        rects = draw_dirty(self.screen)
+        w, h = self.screen.get_size()
+        if sum(r.w * r.h for r in rects) > C.DIRTY_AREA_LIMIT * w * h:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
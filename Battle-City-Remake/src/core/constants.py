@@ -3,7 +3,15 @@ GAME_OVER_EVENT = pygame.USEREVENT + 1
 
 TITLE = "TANK BATTLE"
 WINDOW_SIZE = (800, 600)
-FPS = 60
+FPS = 60            # частота рендера
+SIM_HZ = 60         # частота симуляції: update завжди отримує крок 1/SIM_HZ
+MAX_STEPS = 5       # стільки кроків максимум доганяємо за кадр, решту відкидаємо
+BG_COLOR = (20, 20, 30)
+
+# рендер брудними прямокутниками: display.update(rects) замість flip,
+# поки змінена площа менша за цю частку вікна
+DIRTY_RENDERING = True
+DIRTY_AREA_LIMIT = 0.4
 
 INITIAL_LIVES = 3
 PLAYER_SPEED = 180
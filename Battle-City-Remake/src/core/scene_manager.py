@@ -8,6 +8,7 @@ class IScene:
     def handle_event(self, event: pygame.event.Event): ...
     def update(self, dt: float): ...
     def draw(self, screen: pygame.Surface): ...
+    # необов'язково: draw_dirty(screen) -> список змінених Rect (малює поверх попереднього кадру)
 
 
 # game/core/scene_manager.py (додай методи push/pop, і не чіпай change() для інших переходів)
@@ -1,15 +1,78 @@
 import pygame
+from time import perf_counter_ns
 
 
 class GameClock:
-    def __init__(self, target_fps: int = 60):
+    """
+    Рендер іде з частотою target_fps, симуляція — фіксованими кроками step.
+    tick() додає дельту кадру в акумулятор; steps() каже, скільки кроків виконати цього кадру (не більше max_steps —
+    решта боргу відкидається, щоб повільний кадр не тягнув за собою ще повільніший); alpha — залишок кроку (0..1) для інтерполяції рендера.
+    """
+
+    def __init__(self, target_fps: int = 60, step: float = 1 / 60, max_steps: int = 5):
         self.clock = pygame.time.Clock()
         self.target_fps = target_fps
+        self.step = step
+        self.max_steps = max_steps
         self.delta_time = 0.0
+        self.alpha = 0.0
+        self._lag = 0.0
 
     def tick(self) -> float:
         self.delta_time = self.clock.tick(self.target_fps) / 1000.0
+        self._lag += self.delta_time
         return self.delta_time
 
+    def steps(self) -> int:
+        n = min(int(self._lag / self.step), self.max_steps)
+        self._lag -= n * self.step
+        if self._lag >= self.step:      # не встигаємо — борг понад max_steps відкидаємо
+            self._lag %= self.step
+        self.alpha = self._lag / self.step
+        return n
+
     def get_fps(self) -> float:
         return self.clock.get_fps()
+
+
+class ThinkScheduler:
+    """
+    Розносить «думання» AI по кадрах: think(agent, elapsed) викликається лише для агентів, чия черга настала
+    (period(agent) секунд від минулого рішення), по колу від місця, де зупинився минулий кадр, поки не вичерпано budget_us.
+    Бюджет перевіряється після кожного рішення: розпочате рішення завжди доходить до кінця, тож перший, чия черга настала,
+    думає навіть понад бюджет; якщо ні в кого черга не настала, цього кадру ніхто не думає (thinks == 0).
+    elapsed — ігровий час від попереднього рішення цього агента.
+    """
+
+    def __init__(self, budget_us: int = 500):
+        self.budget_us = budget_us
+        self.now = 0.0
+        self.thinks = 0
+        self._last = {}
+        self._cursor = 0
+
+    def run(self, agents, dt: float, think, period=lambda agent: 0.0):
+        self.now += dt
+        self.thinks = 0
+        agents = list(agents)
+        n = len(agents)
+        if not n:
+            return
+        if len(self._last) > n:
+            alive = set(agents)
+            self._last = {a: t for a, t in self._last.items() if a in alive}
+        start = perf_counter_ns()
+        limit = self.budget_us * 1000
+        first = self._cursor % n
+        for k in range(n):
+            i = (first + k) % n
+            agent = agents[i]
+            last = self._last.get(agent)
+            if last is not None and self.now - last < period(agent):
+                continue
+            think(agent, dt if last is None else self.now - last)
+            self._last[agent] = self.now
+            self.thinks += 1
+            self._cursor = i + 1
+            if perf_counter_ns() - start > limit:
+                break
@@ -1,29 +1,134 @@
+import math
+import numpy as np
 import pygame
 from ..core import constants as C
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, pos, direction: pygame.Vector2, color=(255, 220, 100), damage=25, team="player"):
-        super().__init__()
-        self.image = pygame.Surface((8, 8), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (4, 4), 4)
-        self.rect = self.image.get_rect(center=pos)
-        self.dir = pygame.Vector2(direction)
-        if self.dir.length_squared() == 0:
-            self.dir.update(0, -1)
+TEAM_PLAYER = 0
+TEAM_ENEMY = 1
+TEAMS = {"player": TEAM_PLAYER, "enemy": TEAM_ENEMY}
+
+BULLET_SIZE = 8
+BULLET_COLOR = (255, 220, 100)
+
+
+class BulletPool:
+    """
+    Усі кулі в одному пулі: позиції, напрями, швидкості, шкода, фракція і час життя лежать у заздалегідь виділених масивах NumPy.
+    Живі кулі займають щільний префікс [0, count) — рух інтегрується одним векторним кроком, мертві відсікаються масово.
+    Малюються однією спільною картинкою через Surface.blits.
+    """
+
+    _image = None
+
+    def __init__(self, capacity=256, bounds=None):
+        self.count = 0
+        self.bounds = pygame.Rect(bounds or ((0, 0), C.WINDOW_SIZE))
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.prev = np.zeros((capacity, 2), np.float32)
+        self.dir = np.zeros((capacity, 2), np.float32)
+        self.speed = np.zeros(capacity, np.float32)
+        self.damage = np.zeros(capacity, np.float32)
+        self.team = np.zeros(capacity, np.int8)
+        self.life = np.zeros(capacity, np.float32)
+
+    def _grow(self):
+        n, old = self.count, (self.pos, self.prev, self.dir, self.speed, self.damage, self.team, self.life)
+        self._alloc(self.capacity * 2)
+        for dst, src in zip((self.pos, self.prev, self.dir, self.speed, self.damage, self.team, self.life), old):
+            dst[:n] = src[:n]
+
+    @classmethod
+    def image(cls) -> pygame.Surface:
+        """Спільна картинка кулі — створюється один раз."""
+        if cls._image is None:
+            r = BULLET_SIZE // 2
+            cls._image = pygame.Surface((BULLET_SIZE, BULLET_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(cls._image, BULLET_COLOR, (r, r), r)
+        return cls._image
+
+    def __len__(self):
+        return self.count
+
+    # ------------------------------------
+    def spawn(self, pos, direction, damage=25, team="player", speed=C.BULLET_SPEED, lifetime=2.5):
+        if self.count == self.capacity:
+            self._grow()
+        dx, dy = direction
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dx, dy = 0.0, -1.0
         else:
-            self.dir = self.dir.normalize()
-        self.speed = C.BULLET_SPEED
-        self.damage = damage
-        self.team = team            # ← фракція: "player" або "enemy"
-        self.lifetime = 2.5
+            dx, dy = dx / length, dy / length
+        i = self.count
+        self.pos[i] = pos
+        self.prev[i] = pos
+        self.dir[i] = (dx, dy)
+        self.speed[i] = speed
+        self.damage[i] = damage
+        self.team[i] = TEAMS.get(team, TEAM_PLAYER)
+        self.life[i] = lifetime
+        self.count += 1
+
+    def kill(self, i):
+        """Позначає кулю мертвою; фізично прибирається в cull()."""
+        self.life[i] = 0.0
+
+    def empty(self):
+        self.count = 0
 
+    # ------------------------------------
     def update(self, dt: float):
-        move = self.dir * self.speed * dt
-        self.rect.x += move.x
-        self.rect.y += move.y
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.kill()
-        screen = pygame.display.get_surface()
-        if screen and not screen.get_rect().colliderect(self.rect):
-            self.kill()
+        # відсікаємо тих, хто вилетів минулого кадру: останній відрізок шляху вже перевірили колізії
+        self.cull()
+        n = self.count
+        if not n:
+            return
+        self.prev[:n] = self.pos[:n]
+        self.pos[:n] += self.dir[:n] * (self.speed[:n] * dt)[:, None]
+        self.life[:n] -= dt
+
+    def cull(self):
+        """Прибирає мертві кулі та ті, що вилетіли за екран, одним стисненням масивів."""
+        n = self.count
+        if not n:
+            return
+        r = BULLET_SIZE / 2
+        b = self.bounds
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        keep = ((self.life[:n] > 0)
+                & (x + r > b.left) & (x - r < b.right)
+                & (y + r > b.top) & (y - r < b.bottom))
+        alive = int(np.count_nonzero(keep))
+        if alive == n:
+            return
+        for arr in (self.pos, self.prev, self.dir, self.speed, self.damage, self.team, self.life):
+            arr[:alive] = arr[:n][keep]
+        self.count = alive
+
+    def live(self):
+        """(i, x, y, prev_x, prev_y, team, damage) для кожної живої кулі — для систем колізій."""
+        n = self.count
+        pos, prev = self.pos[:n].tolist(), self.prev[:n].tolist()
+        teams, dmg = self.team[:n].tolist(), self.damage[:n].tolist()
+        for i in range(n):
+            yield i, pos[i][0], pos[i][1], prev[i][0], prev[i][1], teams[i], dmg[i]
+
+    def rect(self, x, y) -> pygame.Rect:
+        r = BULLET_SIZE // 2
+        return pygame.Rect(int(x) - r, int(y) - r, BULLET_SIZE, BULLET_SIZE)
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
+        """
+        Малює всі кулі між позицією до і після останнього кроку (alpha — частка кроку);
+        повертає їхні прямокутники (для часткового оновлення екрана).
+        """
+        n = self.count
+        if not n:
+            return []
+        img, r = self.image(), BULLET_SIZE // 2
+        pos = self.prev[:n] + (self.pos[:n] - self.prev[:n]) * alpha
+        return screen.blits([(img, (x - r, y - r)) for x, y in pos.astype(np.int32).tolist()])
@@ -1,15 +1,19 @@
 import pygame
-import random
 
 class EagleBase(pygame.sprite.Sprite):
     """
     Головна база (Eagle). Якщо її знищено — гра програна.
-    Має власну анімацію, здоров’я, ефекти вибуху.
+    Має здоров’я і блиск при влучанні; вибух і дим над знищеною базою — справа EffectsSystem (його запускає CollisionSystem).
+    Картинки станів (ціла, пошкоджена, блиск) малюються один раз — update лише перемикає їх.
     """
 
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((48, 48), pygame.SRCALPHA)
+        self._normal = self._draw_eagle()
+        self._damaged = self._draw_eagle(damaged=True)
+        self._flash = self._damaged.copy()
+        self._flash.fill((255, 0, 0, 60), special_flags=pygame.BLEND_RGBA_ADD)
+        self.image = self._normal
         self.rect = self.image.get_rect(center=pos)
         self.max_hp = 100
         self.hp = self.max_hp
@@ -17,13 +21,12 @@ class EagleBase(pygame.sprite.Sprite):
         self.flash_timer = 0
         self.exploding = False
         self.explosion_timer = 0
-        self._draw_eagle()
 
     # -------------------------------------------------------
-    def _draw_eagle(self, damaged=False):
+    @staticmethod
+    def _draw_eagle(damaged=False):
         """Малює орла — залежно від стану."""
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
+        surf = pygame.Surface((48, 48), pygame.SRCALPHA)
         center = surf.get_rect().center
 
         # Тіло
@@ -46,6 +49,7 @@ class EagleBase(pygame.sprite.Sprite):
 
         # Контур
         pygame.draw.circle(surf, (80, 60, 0), center, 22, 2)
+        return surf
 
     # -------------------------------------------------------
     def take_damage(self, amount):
@@ -59,8 +63,6 @@ class EagleBase(pygame.sprite.Sprite):
 
         if self.hp <= 0:
             self.destroy()
-        else:
-            self._draw_eagle(damaged=True)
 
     # -------------------------------------------------------
     def destroy(self):
@@ -74,39 +76,24 @@ class EagleBase(pygame.sprite.Sprite):
 
     # -------------------------------------------------------
     def update(self, dt):
-        """Оновлення ефектів — блиск, вибух."""
+        """Оновлення стану — блиск, таймер вибуху. Нічого не малює."""
         if not self.alive and not self.exploding:
             return
 
         if self.flash_timer > 0:
             self.flash_timer -= dt
-            if int(self.flash_timer * 20) % 2 == 0:
-                self.image.fill((255, 0, 0, 60), special_flags=pygame.BLEND_RGBA_ADD)
-        elif self.hp > 0:
-            self._draw_eagle()
+            flash = int(self.flash_timer * 20) % 2 == 0
+            self.image = self._flash if flash else self._damaged
+        elif self.hp < self.max_hp:
+            self.image = self._damaged
 
         if self.exploding:
             self.explosion_timer -= dt
-            radius = random.randint(20, 40)
-            boom = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(boom, (255, random.randint(100,200), 0, 180),
-                               (radius, radius), radius)
-            boom_rect = boom.get_rect(center=self.rect.center)
-            pygame.display.get_surface().blit(boom, boom_rect)
-
             if self.explosion_timer <= 0:
                 self.kill()
 
     # -------------------------------------------------------
     def draw(self, surface):
-        """Малює орла (і якщо знищено — дим)."""
+        """Малює орла; дим над знищеною базою малює EffectsSystem."""
         if self.alive:
             surface.blit(self.image, self.rect)
-        else:
-            smoke = pygame.Surface((50, 50), pygame.SRCALPHA)
-            for i in range(6):
-                c = 150 + random.randint(-20, 20)
-                pygame.draw.circle(smoke, (c, c, c, 120),
-                                   (random.randint(10, 40), random.randint(10, 40)),
-                                   random.randint(4, 10))
-            surface.blit(smoke, self.rect)
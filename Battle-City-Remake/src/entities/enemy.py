@@ -12,13 +12,24 @@ class Enemy(pygame.sprite.Sprite):
         self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
         pygame.draw.rect(self.image, (200, 60, 60), (4, 4, 32, 32), border_radius=6)
         self.rect = self.image.get_rect(center=pos)
+        self.prev = None    # topleft на початку кроку симуляції — для інтерполяції рендера
         self.direction = pygame.Vector2(0, 1)
         self.speed = C.ENEMY_SPEED
         self.hp = C.ENEMY_MAX_HP
         self.change_dir_cd = 0.0
         self.shoot_cd = 0.0
+        self.fire_rate = 0.8
+        self.seeking = False        # True — веде поле потоку до бази
+
+    def can_shoot(self) -> bool:
+        return self.shoot_cd <= 0
+
+    def reset_cooldown(self):
+        self.shoot_cd = self.fire_rate
 
     def update(self, dt):
+        if self.shoot_cd > 0:
+            self.shoot_cd -= dt
         screen_rect = pygame.display.get_surface().get_rect()
         if not screen_rect.contains(self.rect):
             if self.rect.left < 0: self.rect.left = 0; self.direction = pygame.Vector2(1, 0)
@@ -7,8 +7,14 @@ class PowerUp(pygame.sprite.Sprite):
     Підсилення для гравця або ворога.
     Типи: heal, speed, shield, damage.
     Зникає через певний час або після підбору.
+    Кадри блиску (GLOW_PHASES фаз) рендеряться один раз на тип і спільні для всіх підсилень;
+    update лише перемикає індекс кадру.
     """
 
+    GLOW_PHASES = 16
+    _frames = {}    # тип -> [Surface] по фазах блиску
+    _fonts = {}     # розмір -> pygame.font.Font
+
     COLORS = {
         "heal": (120, 255, 120),
         "speed": (120, 180, 255),
@@ -27,27 +33,43 @@ class PowerUp(pygame.sprite.Sprite):
         super().__init__()
         self.type = ptype or random.choice(list(self.COLORS.keys()))
         self.color = self.COLORS[self.type]
-        self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
+        self.frames = self._glow_frames(self.type)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(center=pos)
         self.spawn_y = pos[1]
         self.timer = 10.0  # час життя (секунд)
         self.bounce = 0.0
         self.glow_phase = 0
-        self._draw_powerup()
 
     # ---------------------------------------------------------
-    def _draw_powerup(self):
-        """Малює коло з блиском і іконкою."""
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-        pygame.draw.circle(surf, self.color, (15, 15), 12)
-        pygame.draw.circle(surf, (255, 255, 255), (15, 15), 13, 2)
-
-        font = pygame.font.Font(None, 26)
-        icon = self.ICONS.get(self.type, "?")
-        text = font.render(icon, True, (0, 0, 0))
-        rect = text.get_rect(center=(15, 15))
-        surf.blit(text, rect)
+    @classmethod
+    def _font(cls, size):
+        if size not in cls._fonts:
+            cls._fonts[size] = pygame.font.Font(None, size)
+        return cls._fonts[size]
+
+    @classmethod
+    def _glow_frames(cls, ptype):
+        """Коло з іконкою + блиск для кожної фази; рендериться один раз на тип."""
+        if ptype in cls._frames:
+            return cls._frames[ptype]
+        color = cls.COLORS[ptype]
+        base = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(base, color, (15, 15), 12)
+        pygame.draw.circle(base, (255, 255, 255), (15, 15), 13, 2)
+        text = cls._font(26).render(cls.ICONS.get(ptype, "?"), True, (0, 0, 0))
+        base.blit(text, text.get_rect(center=(15, 15)))
+
+        frames = []
+        for k in range(cls.GLOW_PHASES):
+            glow_alpha = int((math.sin(2 * math.pi * k / cls.GLOW_PHASES) * 0.5 + 0.5) * 100)
+            glow = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (*color, glow_alpha), (15, 15), 14)
+            frame = base.copy()
+            frame.blit(glow, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            frames.append(frame)
+        cls._frames[ptype] = frames
+        return frames
 
     # ---------------------------------------------------------
     def update(self, dt):
@@ -62,12 +84,10 @@ class PowerUp(pygame.sprite.Sprite):
         offset = math.sin(self.bounce) * 5
         self.rect.centery = self.spawn_y + offset
 
-        # блиск
+        # блиск — готовий кадр за фазою
         self.glow_phase += dt * 6
-        glow_alpha = int((math.sin(self.glow_phase) * 0.5 + 0.5) * 100)
-        glow = pygame.Surface((30, 30), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*self.color, glow_alpha), (15, 15), 14)
-        self.image.blit(glow, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        k = int(self.glow_phase / (2 * math.pi) * self.GLOW_PHASES) % self.GLOW_PHASES
+        self.image = self.frames[k]
 
     # ---------------------------------------------------------
     def apply(self, target):
@@ -9,6 +9,7 @@ class Tank(pygame.sprite.Sprite):
         self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
         pygame.draw.rect(self.image, (100, 200, 100), (4, 4, 32, 32), border_radius=8)
         self.rect = self.image.get_rect(center=pos)
+        self.prev = None    # topleft на початку кроку симуляції — для інтерполяції рендера
         self.direction = pygame.Vector2(0, -1)
         self.speed = C.PLAYER_SPEED
         self.max_hp = C.PLAYER_MAX_HP
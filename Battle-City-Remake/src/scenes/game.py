@@ -2,10 +2,12 @@ import pygame
 from ..entities.tank import Tank
 from ..entities.enemy import Enemy
 from ..entities.base import Base
+from ..entities.bullet import BulletPool
 from ..systems.level_system import LevelSystem
 from ..systems.collision_system import CollisionSystem
 from ..systems.shooting_system import ShootingSystem
 from ..systems.ai_system import AISystem
+from ..systems.effects_system import EffectsSystem
 from ..core import constants as C
 import traceback
 
@@ -22,25 +24,34 @@ class GameScene:
 
         self.players = pygame.sprite.GroupSingle()
         self.enemies = pygame.sprite.Group()
-        self.blocks = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
+        self.bullets = BulletPool(bounds=self.screen.get_rect())
         self.base = pygame.sprite.GroupSingle()
 
         self.level = LevelSystem()
         self.shooting = ShootingSystem(self.bullets, audio=self.srv.get("audio"))
         self.ai = AISystem(self.enemies, self.level, self.shooting)
+        self.effects = EffectsSystem(assets)
 
-        self.collisions = CollisionSystem(self.blocks, self.enemies, self.players, self.base, self.bullets, audio=self.srv.get("audio"))
+        self.collisions = CollisionSystem(self.level, self.enemies, self.players, self.base, self.bullets,
+                                          audio=self.srv.get("audio"), effects=self.effects)
+
+        # часткове оновлення кадру: фон (заливка + тайли) і прямокутники, намальовані минулого кадру
+        self.background = None
+        self._drawn = []
 
     def enter(self):
         try:
-            self.level.load_demo_level()
-            self.blocks = self.level.blocks
+            self.level.load_level("level01")
+            self.level.tilemap.listeners.append(self._on_tile_changed)
+            self.background = None
 
-            self.players.add(Tank((C.WINDOW_SIZE[0]//2, C.WINDOW_SIZE[1]-100)))
-            self.base.add(Base((C.WINDOW_SIZE[0]//2, C.WINDOW_SIZE[1]-60)))
-            for i in range(3):
-                self.enemies.add(Enemy((100 + i*150, 120)))
+            w, h = C.WINDOW_SIZE
+            player_pos = self.level.spawn_points("P", [(w//2, h-100)])[0]
+            base_pos = self.level.spawn_points("@", [(w//2, h-60)])[0]
+            self.players.add(Tank(player_pos))
+            self.base.add(Base(base_pos))
+            for pos in self.level.spawn_points("E", [(100 + i*150, 120) for i in range(3)]):
+                self.enemies.add(Enemy(pos))
         except Exception:
             print("GameScene.enter() failed:")
             traceback.print_exc()
@@ -48,7 +59,8 @@ class GameScene:
             self.sm.change("menu")
 
     def exit(self):
-        self.players.empty(); self.enemies.empty(); self.blocks.empty(); self.bullets.empty(); self.base.empty()
+        self.players.empty(); self.enemies.empty(); self.bullets.empty(); self.base.empty()
+        self.effects.clear()
 
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
@@ -57,32 +69,71 @@ class GameScene:
             self.sm.change("game_over")  # перехід у сцену програшу
 
     def update(self, dt):
+        for s in (*self.players, *self.enemies):
+            s.prev = s.rect.topleft
         self.srv["input"].update()
         p = self.players.sprite
         if p:
+            prev = p.rect.copy()
             p.handle_movement(self.srv["input"].move_axis(), dt)
+            if self.level.check_collision(p.rect):
+                p.rect = prev
             p.update(dt)
             if self.srv["input"].action("FIRE"):
                 self.shooting.shoot(p)
         self.enemies.update(dt)
         self.bullets.update(dt)
-        self.ai.update(dt)
-        self.collisions.update()
         if p:
             p.rect.clamp_ip(self.screen.get_rect())
         base_rect = self.base.sprite.rect if self.base.sprite else None
         player_rect = self.players.sprite.rect if self.players.sprite else None
         self.ai.update(dt, base_rect=base_rect, player_rect=player_rect)
         self.collisions.update()
+        self.effects.update(dt)
+
+    def _on_tile_changed(self, cx, cy):
+        if self.background is not None:
+            r = self.level.tilemap.cell_rect(cx, cy)
+            self.background.fill(C.BG_COLOR, r)
+            self.level.draw(self.background, r)
+            self._drawn.append(r)
 
     def draw(self, screen):
-        screen.fill((20, 20, 30))
-        self.level.draw(screen)
-        self.enemies.draw(screen)
-        self.bullets.draw(screen)
+        if self.background is None or self.background.get_size() != screen.get_size():
+            self.background = pygame.Surface(screen.get_size())
+            self.background.fill(C.BG_COLOR)
+            self.level.draw(self.background)
+        screen.blit(self.background, (0, 0))
+        self._drawn = self._draw_moving(screen)
+
+    def draw_dirty(self, screen):
+        """Стирає фоном те, що малювалося минулого кадру, малює рухоме; повертає змінені прямокутники."""
+        if self.background is None:
+            self.draw(screen)
+            return [screen.get_rect()]
+        erased = self._drawn
+        screen.blits([(self.background, r, r) for r in erased], False)
+        self._drawn = self._draw_moving(screen)
+        return erased + self._drawn
+
+    @staticmethod
+    def _lerp(sprite, alpha):
+        """Прямокутник між позицією на початку кроку симуляції і поточною."""
+        prev, rect = sprite.prev, sprite.rect
+        if prev is None or prev == rect.topleft:
+            return rect
+        k = 1.0 - alpha
+        return rect.move(round((prev[0] - rect.x) * k), round((prev[1] - rect.y) * k))
+
+    def _draw_moving(self, screen):
+        alpha = self.srv["clock"].alpha
+        rects = screen.blits([(e.image, self._lerp(e, alpha)) for e in self.enemies])
+        rects += self.bullets.draw(screen, alpha)
         if self.base.sprite:
-            screen.blit(self.base.sprite.image, self.base.sprite.rect)
+            rects.append(screen.blit(self.base.sprite.image, self.base.sprite.rect))
+        rects += self.effects.draw(screen)
         if self.players.sprite:
-            screen.blit(self.players.sprite.image, self.players.sprite.rect)
+            rects.append(screen.blit(self.players.sprite.image, self._lerp(self.players.sprite, alpha)))
             txt = self.font.render(f"HP: {self.players.sprite.hp}", True, (255,255,255))
-            screen.blit(txt, (10, 10))
+            rects.append(screen.blit(txt, (10, 10)))
+        return rects
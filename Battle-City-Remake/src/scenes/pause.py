@@ -19,6 +19,9 @@ class PauseScene:
             Button((cx, cy - 40, bw, bh), "Продовжити", self._resume, self.btn_font),
             Button((cx, cy + 40, bw, bh), "В меню", self._to_menu, self.btn_font),
         ]
+        # знімок останнього кадру гри — вже затемнений і з заголовком; малюється один раз на вхід у паузу
+        self.snapshot = None
+        self._hovered = []
 
     def _resume(self):
         # повертаємось до попередньої сцени (див. push/pop нижче)
@@ -29,8 +32,18 @@ class PauseScene:
         self.sm.pop()         # прибрати паузу
         self.sm.change("menu")
 
-    def enter(self): pass
-    def exit(self): pass
+    def enter(self):
+        # на екрані ще кадр GameScene — його й фотографуємо
+        screen = self.screen
+        self.snapshot = screen.copy()
+        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        self.snapshot.blit(overlay, (0, 0))
+        title = self.title_font.render("ПАУЗА", True, (255, 255, 255))
+        self.snapshot.blit(title, title.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 100)))
+
+    def exit(self):
+        self.snapshot = None
 
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
@@ -43,11 +56,19 @@ class PauseScene:
         pass
 
     def draw(self, screen):
-        # просто затемнюємо і малюємо UI поверх вже відрендереної GameScene
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
-        title = self.title_font.render("ПАУЗА", True, (255, 255, 255))
-        screen.blit(title, title.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 100)))
+        # готовий затемнений знімок гри + кнопки
+        screen.blit(self.snapshot, (0, 0))
         for b in self.buttons:
             b.draw(screen)
+        self._hovered = [b.hovered for b in self.buttons]
+
+    def draw_dirty(self, screen):
+        """Перемальовує лише кнопки, у яких змінився стан наведення; інакше кадр не змінюється."""
+        rects = []
+        for i, b in enumerate(self.buttons):
+            if b.hovered != self._hovered[i]:
+                screen.blit(self.snapshot, b.rect, b.rect)
+                b.draw(screen)
+                self._hovered[i] = b.hovered
+                rects.append(b.rect)
+        return rects
@@ -2,22 +2,25 @@ import os
 import pygame
 import yaml
 
-# шлях до папки з ресурсами (звідки запустиш run.py)
-ASSETS_DIR = r"C:\Users\vlad\PycharmProjects\Battle-City-Remake\src\assets"
-
+# шлях до папки з ресурсами — відносно цього файлу, а не робочої теки
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
 
 
 class ResourceManager:
     """
     Менеджер ресурсів: зчитує resources.yaml і надає методи для отримання зображень, звуків, шрифтів.
     Якщо файл відсутній — створює плейсхолдер (Surface із кольором).
+    Атласи (секція atlases): лист завантажується й конвертується один раз, кадри/регіони — subsurface цього листа.
+    Якщо спрайт лежить у зібраному атласі (regions), image() віддає регіон замість окремого файлу.
     """
 
     def __init__(self, yaml_file: str = "resources.yaml"):
         self.yaml_path = os.path.join(ASSETS_DIR, yaml_file)
-        self._data = {"sprites": {}, "sounds": {}, "fonts": {}}
+        self._data = {"sprites": {}, "atlases": {}, "sounds": {}, "fonts": {}}
         self._cache = {}
+        self._regions = {}      # шлях вихідного PNG -> (ключ атласу, [x, y, w, h])
         self._load_yaml()
+        self._load_regions()
 
     # ------------------------------------
     def _load_yaml(self):
@@ -27,6 +30,14 @@ class ResourceManager:
         else:
             print(f"[assets] Warning: {self.yaml_path} not found. Using placeholders.")
 
+    def _load_regions(self):
+        for key, info in (self._data.get("atlases") or {}).items():
+            path = self._full(info["regions"]) if info.get("regions") else None
+            if path and os.path.exists(path) and os.path.exists(self._full(info["file"])):
+                with open(path, "r", encoding="utf-8") as f:
+                    for rel, rect in (yaml.safe_load(f) or {}).items():
+                        self._regions[rel] = (key, rect)
+
     # ------------------------------------
     def _full(self, rel_path: str):
         """Отримати повний шлях до файлу."""
@@ -40,7 +51,12 @@ class ResourceManager:
 
         surf = None
         info = self._data.get("sprites", {}).get(key)
-        if info:
+        if info and info["file"] in self._regions:
+            atlas_key, rect = self._regions[info["file"]]
+            sheet = self._sheet(atlas_key)
+            if sheet is not None:
+                surf = sheet.subsurface(rect)
+        elif info:
             path = self._full(info["file"])
             if os.path.exists(path):
                 try:
@@ -55,6 +71,52 @@ class ResourceManager:
         self._cache[key] = surf
         return surf
 
+    # ------------------------------------
+    def _sheet(self, key: str):
+        """Лист атласу: один файл, один convert_alpha(). None, якщо файлу немає."""
+        cache_key = ("atlas", key)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        sheet = None
+        info = self._data.get("atlases", {}).get(key)
+        if info:
+            path = self._full(info["file"])
+            if os.path.exists(path):
+                try:
+                    sheet = pygame.image.load(path).convert_alpha()
+                except Exception:
+                    sheet = None
+
+        self._cache[cache_key] = sheet
+        return sheet
+
+    def has_sheet(self, key: str) -> bool:
+        """Чи є лист атласу key на диску (інакше frames() віддасть плейсхолдери)."""
+        return self._sheet(key) is not None
+
+    def frames(self, key: str, color=(200, 200, 200)) -> list:
+        """
+        Кадри атласу-сітки (frame_size, frames) як subsurface одного листа, рядок за рядком.
+        Якщо листа немає — кадри-плейсхолдери того ж розміру.
+        """
+        cache_key = ("frames", key)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        info = self._data.get("atlases", {}).get(key) or {}
+        fw, fh = info.get("frame_size", (32, 32))
+        count = info.get("frames", 1)
+        sheet = self._sheet(key)
+        if sheet is None:
+            sheet = pygame.Surface((fw * count, fh), pygame.SRCALPHA)
+            sheet.fill((*color, 255))
+        cols = max(sheet.get_width() // fw, 1)
+        frames = [sheet.subsurface(((i % cols) * fw, (i // cols) * fh, fw, fh)) for i in range(count)]
+
+        self._cache[cache_key] = frames
+        return frames
+
     # ------------------------------------
     def sound(self, key: str):
         """Отримати звук (pygame.mixer.Sound)."""
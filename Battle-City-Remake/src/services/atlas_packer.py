@@ -0,0 +1,60 @@
+import os
+import pygame
+import yaml
+
+# крок збірки: пакує розсипані PNG з src/assets/images/ в один лист і індекс регіонів.
+# Запуск із кореня Battle-City-Remake:  python -m src.services.atlas_packer
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
+ATLAS_DIR = os.path.join(IMAGES_DIR, "atlas")
+
+
+def collect(images_dir=IMAGES_DIR, skip=(ATLAS_DIR,)):
+    """Шляхи PNG відносно ASSETS_DIR (як у resources.yaml), без уже зібраних листів."""
+    found = []
+    for root, dirs, files in os.walk(images_dir):
+        if any(os.path.abspath(root).startswith(os.path.abspath(s)) for s in skip):
+            continue
+        for name in sorted(files):
+            if name.lower().endswith(".png"):
+                rel = os.path.relpath(os.path.join(root, name), ASSETS_DIR)
+                found.append(rel.replace(os.sep, "/"))
+    return sorted(found)
+
+
+def pack(sizes, max_width=1024, padding=1):
+    """
+    Полична укладка: прямокутники за спаданням висоти кладуться в ряди шириною max_width.
+    sizes — {ім'я: (w, h)}; повертає ({ім'я: [x, y, w, h]}, (ширина, висота) листа).
+    """
+    regions = {}
+    x = y = shelf_h = width = 0
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], n)):
+        w, h = sizes[name]
+        if x and x + w > max_width:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        regions[name] = [x, y, w, h]
+        x += w + padding
+        width = max(width, x - padding)
+        shelf_h = max(shelf_h, h)
+    return regions, (max(width, 1), max(y + shelf_h, 1))
+
+
+def build(name="sprites", images_dir=IMAGES_DIR, out_dir=ATLAS_DIR, max_width=1024):
+    """Збирає <out_dir>/<name>.png і <name>.yaml (регіони за шляхом вихідного файлу)."""
+    images = {rel: pygame.image.load(os.path.join(ASSETS_DIR, rel)) for rel in collect(images_dir)}
+    regions, size = pack({rel: img.get_size() for rel, img in images.items()}, max_width)
+    sheet = pygame.Surface(size, pygame.SRCALPHA)
+    for rel, (x, y, w, h) in regions.items():
+        sheet.blit(images[rel], (x, y))
+
+    os.makedirs(out_dir, exist_ok=True)
+    pygame.image.save(sheet, os.path.join(out_dir, f"{name}.png"))
+    with open(os.path.join(out_dir, f"{name}.yaml"), "w", encoding="utf-8") as f:
+        yaml.safe_dump(regions, f, default_flow_style=None, sort_keys=True)
+    print(f"[atlas] {len(regions)} images -> {name}.png {size[0]}x{size[1]}")
+    return regions
+
+
+if __name__ == "__main__":
+    build()
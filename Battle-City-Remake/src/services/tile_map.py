@@ -0,0 +1,203 @@
+import math
+import pygame
+
+# Легенда текстових мап у src/data/levels/*.txt
+EMPTY, BRICK, STEEL, BUSH, ICE, WATER = range(6)
+
+LEGEND = {
+    ".": EMPTY,
+    "#": BRICK,
+    "S": STEEL,
+    "B": BUSH,
+    "I": ICE,
+    "W": WATER,
+}
+SPAWN_SYMBOLS = "PE@"   # гравець, ворог, база — у сітці це порожні клітинки
+
+# прапорці клітинки
+F_SOLID = 1     # не пускає танки
+F_SHOT = 2      # зупиняє кулі
+
+KIND_FLAGS = bytes([
+    0,                   # EMPTY
+    F_SOLID | F_SHOT,    # BRICK
+    F_SOLID | F_SHOT,    # STEEL
+    0,                   # BUSH
+    0,                   # ICE
+    F_SOLID,             # WATER — кулі пролітають над водою
+])
+KIND_HP = bytes([0, 50, 0, 0, 0, 0])   # 0 — нерушимий тайл
+
+KIND_COLORS = {
+    BRICK: (180, 70, 40),
+    STEEL: (140, 140, 150),
+    BUSH: (40, 130, 60),
+    ICE: (170, 210, 240),
+    WATER: (40, 90, 170),
+}
+
+
+class TileMap:
+    """
+    Компактна мапа тайлів: тип, HP і прапорці кожної клітинки зберігаються в bytearray (по байту на клітинку).
+    Жодних спрайтів на тайл — запит по rect зводиться до кількох індексів у масиві.
+    Слухачі (listeners) отримують (cx, cy), коли тайл змінюється (наприклад, цеглу зруйновано).
+    """
+
+    def __init__(self, cols, rows, tile_size=32):
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.kind = bytearray(cols * rows)
+        self.hp = bytearray(cols * rows)
+        self.flags = bytearray(cols * rows)
+        self.spawns = {}        # символ -> [(px, py), ...] центри клітинок
+        self.listeners = []
+
+    # ------------------------------------
+    @classmethod
+    def from_rows(cls, rows, tile_size=32):
+        """Будує мапу з рядків тексту (див. LEGEND)."""
+        rows = [r.rstrip("\r\n") for r in rows if r.strip()]
+        tm = cls(max((len(r) for r in rows), default=0), len(rows), tile_size)
+        for cy, row in enumerate(rows):
+            for cx, ch in enumerate(row):
+                if ch in SPAWN_SYMBOLS:
+                    tm.spawns.setdefault(ch, []).append(tm.cell_center(cx, cy))
+                else:
+                    tm._set(cx, cy, LEGEND.get(ch, EMPTY))
+        return tm
+
+    @classmethod
+    def load(cls, path: str, tile_size=32):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_rows(f.readlines(), tile_size)
+
+    # ------------------------------------
+    def _set(self, cx, cy, kind):
+        i = cy * self.cols + cx
+        self.kind[i] = kind
+        self.hp[i] = KIND_HP[kind]
+        self.flags[i] = KIND_FLAGS[kind]
+
+    def set(self, cx, cy, kind):
+        """Змінює тип тайла і сповіщає слухачів."""
+        if self.in_bounds(cx, cy):
+            self._set(cx, cy, kind)
+            self._changed(cx, cy)
+
+    def _changed(self, cx, cy):
+        for listener in self.listeners:
+            listener(cx, cy)
+
+    # ------------------------------------
+    @property
+    def pixel_size(self):
+        return self.cols * self.tile_size, self.rows * self.tile_size
+
+    def in_bounds(self, cx, cy) -> bool:
+        return 0 <= cx < self.cols and 0 <= cy < self.rows
+
+    def cell_of(self, x, y):
+        return int(x) // self.tile_size, int(y) // self.tile_size
+
+    def cell_center(self, cx, cy):
+        ts = self.tile_size
+        return cx * ts + ts // 2, cy * ts + ts // 2
+
+    def cell_rect(self, cx, cy) -> pygame.Rect:
+        ts = self.tile_size
+        return pygame.Rect(cx * ts, cy * ts, ts, ts)
+
+    def kind_at(self, cx, cy) -> int:
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.kind[cy * self.cols + cx]
+        return EMPTY
+
+    def is_solid(self, cx, cy) -> bool:
+        """Єдина відповідь «чи прохідна клітинка» для руху, AI і колізій."""
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return bool(self.flags[cy * self.cols + cx] & F_SOLID)
+        return False
+
+    def stops_bullets(self, cx, cy) -> bool:
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return bool(self.flags[cy * self.cols + cx] & F_SHOT)
+        return False
+
+    # ------------------------------------
+    def cells_in_rect(self, rect: pygame.Rect):
+        """Клітинки під rect (обрізані межами мапи)."""
+        ts = self.tile_size
+        cx0 = max(rect.left // ts, 0)
+        cy0 = max(rect.top // ts, 0)
+        cx1 = min((rect.right - 1) // ts, self.cols - 1)
+        cy1 = min((rect.bottom - 1) // ts, self.rows - 1)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                yield cx, cy
+
+    def rect_solid(self, rect: pygame.Rect) -> bool:
+        flags, cols = self.flags, self.cols
+        for cx, cy in self.cells_in_rect(rect):
+            if flags[cy * cols + cx] & F_SOLID:
+                return True
+        return False
+
+    # ------------------------------------
+    def damage(self, cx, cy, amount) -> bool:
+        """Шкода тайлу. Повертає True, якщо тайл зруйновано."""
+        i = cy * self.cols + cx
+        if self.hp[i] == 0:
+            return False            # сталь та інші нерушимі
+        hp = self.hp[i] - int(amount)
+        if hp > 0:
+            self.hp[i] = hp
+            return False
+        self.set(cx, cy, EMPTY)
+        return True
+
+    def sweep(self, x0, y0, x1, y1, half, mask=F_SHOT):
+        """
+        raycast для квадрата з півстороною half (центр (x0, y0) → (x1, y1)): промені з чотирьох кутів,
+        тож зачіпання краєм теж влучання. Тайл не менший за квадрат, тож між кутовими променями не проскочить.
+        Повертає найближчу по ходу руху клітинку з прапорцем mask або None.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        ts = self.tile_size
+        best, best_d = None, math.inf
+        for ox in (-half, half - 1):
+            for oy in (-half, half - 1):
+                cell = self.raycast(x0 + ox, y0 + oy, x1 + ox, y1 + oy, mask)
+                if cell is not None:
+                    d = ((cell[0] + 0.5) * ts - x0) * dx + ((cell[1] + 0.5) * ts - y0) * dy
+                    if d < best_d:
+                        best, best_d = cell, d
+        return best
+
+    def raycast(self, x0, y0, x1, y1, mask=F_SHOT):
+        """
+        Перша клітинка з прапорцем mask на відрізку (x0, y0) → (x1, y1), або None.
+        DDA-обхід сітки (Amanatides–Woo): лише клітинки, які перетинає відрізок, незалежно від FPS.
+        """
+        ts = self.tile_size
+        fx0, fy0, fx1, fy1 = x0 / ts, y0 / ts, x1 / ts, y1 / ts
+        cx, cy = math.floor(fx0), math.floor(fy0)
+        ex, ey = math.floor(fx1), math.floor(fy1)
+        dx, dy = fx1 - fx0, fy1 - fy0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        delta_x = abs(1 / dx) if dx else math.inf
+        delta_y = abs(1 / dy) if dy else math.inf
+        max_x = ((cx + 1 - fx0) if dx > 0 else (fx0 - cx)) * delta_x if dx else math.inf
+        max_y = ((cy + 1 - fy0) if dy > 0 else (fy0 - cy)) * delta_y if dy else math.inf
+
+        flags, cols, rows = self.flags, self.cols, self.rows
+        for _ in range(abs(ex - cx) + abs(ey - cy) + 1):
+            if 0 <= cx < cols and 0 <= cy < rows and flags[cy * cols + cx] & mask:
+                return cx, cy
+            if max_x < max_y:
+                cx += step_x; max_x += delta_x
+            else:
+                cy += step_y; max_y += delta_y
+        return None
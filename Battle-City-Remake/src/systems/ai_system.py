@@ -1,6 +1,8 @@
 # systems/ai_system.py
 import pygame, random
 from pygame import Vector2
+from .flow_field import FlowField
+from ..core.time import ThinkScheduler
 
 class AISystem:
     def __init__(self, enemies, level_system, shooting_system):
@@ -9,25 +11,87 @@ class AISystem:
         self.shooting_system = shooting_system
         self.change_dir_time = 1000  # мс
         self._screen_rect = pygame.display.get_surface().get_rect()
+        self.flow = None             # спільне поле до бази, див. FlowField
+        self.fire_chance = 0.9       # випадкових пострілів за секунду (≈1.5% на кадр при 60 FPS)
+        # рішення розносяться по кадрах у межах бюджету; далекі від гравця й бази вороги думають рідше
+        self.scheduler = ThinkScheduler(budget_us=500)
+        self.near = 200              # px
+        self.near_period = 0.1
+        self.far_period = 0.3
+
+    def _flow_field(self, base_rect):
+        """Поле будується один раз на рівень/позицію бази, далі лише латається TileMap-слухачем."""
+        tilemap = getattr(self.level_system, "tilemap", None)
+        if base_rect is None or tilemap is None:
+            return self.flow
+        if (self.flow is None or self.flow.tilemap is not tilemap
+                or self.flow.goal != self.flow.node_of(*base_rect.center)):
+            self.flow = FlowField(tilemap, base_rect.center)
+        return self.flow
 
     def update(self, dt, base_rect=None, player_rect=None):
-        now = pygame.time.get_ticks()
+        flow = self._flow_field(base_rect)
+        self.scheduler.run(self.enemies, dt,
+                           lambda enemy, elapsed: self._think(enemy, elapsed, flow, base_rect),
+                           lambda enemy: self._period(enemy, base_rect, player_rect))
+        # рух із dt — щокадру для всіх
         for enemy in self.enemies:
-            # 1) періодична зміна напряму
-            if not hasattr(enemy, "last_change") or now - enemy.last_change > self.change_dir_time:
-                enemy.last_change = now
-                # якщо є база — 70% наводимось у її бік, інакше випадково
-                if base_rect and random.random() < 0.7:
-                    self._aim_enemy(enemy, base_rect.center)
-                else:
-                    enemy.direction = random.choice([Vector2(1,0), Vector2(-1,0), Vector2(0,1), Vector2(0,-1)])
-
-            # 2) рух із dt
             self._move_enemy(enemy, dt)
 
-            # 3) рідкі постріли у бік напряму
-            if random.random() < 0.015:
-                self.shooting_system.shoot(enemy)
+    def _period(self, enemy, base_rect, player_rect):
+        x, y = enemy.rect.center
+        for r in (player_rect, base_rect):
+            if r and abs(x - r.centerx) + abs(y - r.centery) <= self.near:
+                return self.near_period
+        return self.far_period
+
+    def _think(self, enemy, elapsed, flow, base_rect):
+        now = pygame.time.get_ticks()
+        # 1) періодична зміна режиму
+        if not hasattr(enemy, "last_change") or now - enemy.last_change > self.change_dir_time:
+            enemy.last_change = now
+            # якщо є база — 70% їдемо полем потоку до неї, інакше випадково
+            enemy.seeking = bool(flow) and random.random() < 0.7
+            if not enemy.seeking:
+                enemy.direction = random.choice([Vector2(1,0), Vector2(-1,0), Vector2(0,1), Vector2(0,-1)])
+
+        # наступний крок до бази — O(1) читання з поля
+        enemy.waypoint = None
+        if enemy.seeking and flow:
+            if not self._follow_flow(enemy, flow) and base_rect:
+                self._aim_enemy(enemy, base_rect.center)
+
+        # 2) рідкі постріли у бік напряму
+        if random.random() < self.fire_chance * elapsed:
+            self.shooting_system.shoot(enemy)
+
+    def _follow_flow(self, enemy, flow):
+        """Бере з поля наступний вузол — до нього ворог їде щокадру в _steer."""
+        nxt = flow.next_step(*enemy.rect.center)
+        if nxt is None:
+            return False
+        (dx, dy), (vx, vy) = nxt
+        enemy.waypoint = flow.node_pos(vx + dx, vy + dy)
+        enemy.direction = Vector2(dx, dy)
+        return True
+
+    def _steer(self, enemy, step):
+        """
+        Зсув до вузла поля без перельоту: спершу вирівнювання по меншій осі, потім рух по більшій, щоб не чіпляти кути.
+        None — вузол досягнуто, далі їдемо за напрямом.
+        """
+        ox = enemy.waypoint[0] - enemy.rect.centerx
+        oy = enemy.waypoint[1] - enemy.rect.centery
+        if ox and oy:
+            if abs(ox) < abs(oy):
+                oy = 0
+            else:
+                ox = 0
+        if not (ox or oy):
+            enemy.waypoint = None
+            return None
+        enemy.direction = Vector2((ox > 0) - (ox < 0), (oy > 0) - (oy < 0))
+        return Vector2(max(-step, min(step, ox)), max(-step, min(step, oy)))
 
     def _aim_enemy(self, enemy, target_pos):
         v = Vector2(target_pos) - Vector2(enemy.rect.center)
@@ -48,6 +112,8 @@ class AISystem:
             d = Vector2(0, 1)
         speed = getattr(enemy, "speed", 80)
         move = d * speed * dt
+        if getattr(enemy, "waypoint", None) is not None:
+            move = self._steer(enemy, speed * dt) or enemy.direction * speed * dt
         new_rect = enemy.rect.move(move.x, move.y)
 
         # кордони екрана (кламп + легкий поштовх всередину)
@@ -76,6 +142,12 @@ class AISystem:
 
         if not collides:
             enemy.rect = new_rect
+        elif getattr(enemy, "seeking", False):
+            # шлях поля веде крізь цеглу — пробиваємо її
+            self.shooting_system.shoot(enemy)
+        elif self.flow:
+            # уперлися у стіну у випадковому режимі — далі ведемо полем, а не туди-сюди
+            enemy.seeking = True
         else:
             enemy.direction *= -1
             enemy.last_change = pygame.time.get_ticks()
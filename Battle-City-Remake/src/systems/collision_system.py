@@ -1,57 +1,70 @@
 import pygame
 
 from src.core.constants import GAME_OVER_EVENT
+from ..entities.bullet import TEAM_PLAYER, TEAM_ENEMY, BULLET_SIZE
 
 
 class CollisionSystem:
-    def __init__(self, blocks, enemies, player, base, bullets, audio=None):
-        self.blocks = blocks
+    def __init__(self, level, enemies, player, base, bullets, audio=None, effects=None):
+        self.level = level            # LevelSystem; тайли — у level.tilemap
         self.enemies = enemies
         self.player = player          # GroupSingle
         self.base = base              # GroupSingle
-        self.bullets = bullets
+        self.bullets = bullets        # BulletPool
         self.audio = audio
+        self.effects = effects        # EffectsSystem: вибух на місці знищеного
+
+    def _explode(self, pos, smoke=False):
+        if self.effects:
+            self.effects.spawn("explosion", pos)
+            if smoke:
+                self.effects.spawn("smoke", pos, loop=True)
 
     def update(self):
         p = self.player.sprite
         b = self.base.sprite
 
         # --- кулі ---
-        for bullet in list(self.bullets):
-            # по блоках
-            hit_blocks = pygame.sprite.spritecollide(bullet, self.blocks, False)
-            if hit_blocks:
-                for blk in hit_blocks:
-                    if hasattr(blk, "take_damage"):
-                        blk.take_damage(getattr(bullet, "damage", 25))
-                bullet.kill()
+        pool = self.bullets
+        tm = self.level.tilemap
+        for i, x, y, px, py, team, damage in pool.live():
+            # по тайлах — перший тайл на шляху кулі за кадр (DDA з кутів кулі — зачіпання краєм теж рахується)
+            cell = tm.sweep(px, py, x, y, BULLET_SIZE // 2)
+            if cell:
+                tm.damage(*cell, damage)
+                pool.kill(i)
                 continue
 
+            rect = pool.rect(x, y)
             # по ворогах (тільки якщо куля гравця)
-            if bullet.team == "player":
-                hit_enemies = pygame.sprite.spritecollide(bullet, self.enemies, False)
+            if team == TEAM_PLAYER:
+                hit_enemies = [e for e in self.enemies if rect.colliderect(e.rect)]
                 if hit_enemies:
                     for e in hit_enemies:
-                        e.hp -= getattr(bullet, "damage", 25)
+                        e.hp -= damage
                         if e.hp <= 0:
                             e.kill()
-                    bullet.kill()
+                            self._explode(e.rect.center)
+                    pool.kill(i)
                     continue
 
             # по гравцю/базі (тільки якщо куля ворога)
-            if bullet.team == "enemy":
-                if p and p.alive() and bullet.rect.colliderect(p.rect):
-                    p.hp -= getattr(bullet, "damage", 25)
-                    bullet.kill()
+            if team == TEAM_ENEMY:
+                if p and p.alive() and rect.colliderect(p.rect):
+                    p.hp -= damage
+                    pool.kill(i)
                     if p.hp <= 0:
                         p.kill()
+                        self._explode(p.rect.center)
                     continue
-                if b and bullet.rect.colliderect(b.rect):
-                    b.hp -= getattr(bullet, "damage", 25)
-                    bullet.kill()
+                if b and rect.colliderect(b.rect):
+                    b.hp -= damage
+                    pool.kill(i)
                     if b.hp <= 0:
                         b.kill()
+                        self._explode(b.rect.center, smoke=True)
                     continue
+        pool.cull()
 
         # --- контактні колізії без урону ---
         # гравець ↔ вороги: більше НЕ наносимо урон, максимум — розсунути
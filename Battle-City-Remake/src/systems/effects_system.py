@@ -0,0 +1,127 @@
+import math
+import random
+import pygame
+
+EXPLOSION_FRAMES = 12
+SMOKE_FRAMES = 8
+
+
+class Effect(pygame.sprite.Sprite):
+    """Одна програвана анімація: спільні кадри з банку, індекс кадру й таймер. Нічого не малює сама."""
+
+    def __init__(self, frames, pos, fps, loop):
+        super().__init__()
+        self.reset(frames, pos, fps, loop)
+
+    def reset(self, frames, pos, fps, loop):
+        self.frames = frames
+        self.fps = fps
+        self.loop = loop
+        self.time = 0.0
+        self.image = frames[0]
+        self.rect = self.image.get_rect(center=pos)
+
+    def update(self, dt):
+        self.time += dt
+        i = int(self.time * self.fps)
+        if i >= len(self.frames):
+            if not self.loop:
+                self.kill()
+                return
+            i %= len(self.frames)
+        self.image = self.frames[i]
+
+
+class EffectsSystem:
+    """
+    Вибухи й дим як пул спрайтів Effect.
+    Кадри беруться з атласу explosions (якщо лист є на диску) або генеруються один раз на процес і спільні для всіх ефектів.
+    update() лише рахує кадри — працює й без дисплея; малюються ефекти в draw(), у проході рендера сцени.
+    """
+
+    _generated = {}     # вид -> [Surface], згенеровані кадри
+
+    def __init__(self, assets=None):
+        self.active = pygame.sprite.Group()
+        self._free = []
+        self.banks = {
+            "explosion": self._atlas(assets, "explosions") or self._bank("explosion"),
+            "smoke": self._bank("smoke"),
+        }
+        self.fps = {"explosion": 20, "smoke": 8}
+
+    # ------------------------------------
+    @staticmethod
+    def _atlas(assets, key):
+        if assets is not None and assets.has_sheet(key):
+            return assets.frames(key)
+        return None
+
+    @classmethod
+    def _bank(cls, kind):
+        if kind not in cls._generated:
+            make = cls._explosion_frames if kind == "explosion" else cls._smoke_frames
+            cls._generated[kind] = make()
+        return cls._generated[kind]
+
+    @staticmethod
+    def _explosion_frames(size=64):
+        """Вогняна куля: росте, жовтіє в центрі й згасає."""
+        frames = []
+        c = size // 2
+        for k in range(EXPLOSION_FRAMES):
+            t = k / (EXPLOSION_FRAMES - 1)
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            alpha = int(230 * (1 - t) ** 0.7)
+            radius = int(8 + (c - 8) * math.sin(t * math.pi / 2))
+            pygame.draw.circle(surf, (255, 120, 0, alpha), (c, c), radius)
+            pygame.draw.circle(surf, (255, 200, 60, alpha), (c, c), int(radius * 0.65))
+            pygame.draw.circle(surf, (255, 250, 200, alpha), (c, c), int(radius * 0.3 * (1 - t)))
+            frames.append(surf)
+        return frames
+
+    @staticmethod
+    def _smoke_frames(size=50):
+        """Клуби диму, що повільно піднімаються; зациклюється."""
+        rng = random.Random(7)
+        puffs = [(rng.randint(10, 40), rng.randint(15, 40), rng.randint(4, 10), 150 + rng.randint(-20, 20))
+                 for _ in range(6)]
+        frames = []
+        for k in range(SMOKE_FRAMES):
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            for x, y, r, c in puffs:
+                py = (y - k * size // SMOKE_FRAMES) % size
+                pygame.draw.circle(surf, (c, c, c, 120), (x, py), r)
+            frames.append(surf)
+        return frames
+
+    # ------------------------------------
+    def spawn(self, kind, pos, loop=False):
+        frames, fps = self.banks[kind], self.fps[kind]
+        if self._free:
+            fx = self._free.pop()
+            fx.reset(frames, pos, fps, loop)
+        else:
+            fx = Effect(frames, pos, fps, loop)
+        self.active.add(fx)
+        return fx
+
+    def stop(self, fx):
+        """Зупиняє ефект (наприклад, зациклений дим) і повертає його в пул."""
+        if fx.alive():
+            fx.kill()
+            self._free.append(fx)
+
+    def update(self, dt):
+        for fx in list(self.active):
+            fx.update(dt)
+            if not fx.alive():
+                self._free.append(fx)
+
+    def clear(self):
+        for fx in list(self.active):
+            self.stop(fx)
+
+    def draw(self, screen):
+        """Малює активні ефекти; повертає прямокутники для часткового оновлення екрана."""
+        return screen.blits([(fx.image, fx.rect) for fx in self.active])
@@ -0,0 +1,139 @@
+import heapq
+from ..services.tile_map import F_SOLID
+
+INF = float("inf")
+BRICK_COST = 6      # прорватися крізь цеглу можна, але це довше за обхід
+
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class FlowField:
+    """
+    Спільне поле відстаней до цілі (бази) для всіх ворогів — Dijkstra по TileMap.
+    Вузли — кути клітинок: танк 40x40, центрований у куті, займає рівно 2x2 тайли, тож проходить коридор шириною 2 тайли.
+    Вузол непрохідний, якщо хоч один із 4 тайлів — нерушимий суцільний (сталь/вода); цегла дає BRICK_COST.
+    Рахується один раз; коли тайл змінюється (цеглу зруйновано) — поле латається локально, без повного перерахунку.
+    Кожен ворог читає наступний крок за O(1).
+    """
+
+    def __init__(self, tilemap, goal_pos):
+        self.tilemap = tilemap
+        self.tile_size = tilemap.tile_size
+        self.w = tilemap.cols + 1
+        self.h = tilemap.rows + 1
+        self.goal = self.node_of(*goal_pos)
+        self.cost = [INF] * (self.w * self.h)
+        self.dist = [INF] * (self.w * self.h)
+        for vy in range(self.h):
+            for vx in range(self.w):
+                self.cost[vy * self.w + vx] = self._node_cost(vx, vy)
+        self._build()
+        tilemap.listeners.append(self._on_tile_changed)
+
+    # ------------------------------------
+    def node_of(self, x, y):
+        ts = self.tile_size
+        vx = min(max(int(round(x / ts)), 0), self.w - 1)
+        vy = min(max(int(round(y / ts)), 0), self.h - 1)
+        return vx, vy
+
+    def node_pos(self, vx, vy):
+        return vx * self.tile_size, vy * self.tile_size
+
+    def _node_cost(self, vx, vy):
+        """Вартість стояти у вузлі: максимум по 4 тайлах навколо кута."""
+        tm = self.tilemap
+        if not (0 < vx < tm.cols and 0 < vy < tm.rows):
+            return INF                      # танк вилазить за мапу
+        cost = 1
+        for cx in (vx - 1, vx):
+            for cy in (vy - 1, vy):
+                i = cy * tm.cols + cx
+                if tm.flags[i] & F_SOLID:
+                    if tm.hp[i] == 0:
+                        return INF          # сталь, вода
+                    cost = BRICK_COST
+        return cost
+
+    def _build(self):
+        dist = self.dist
+        for i in range(len(dist)):
+            dist[i] = INF
+        gx, gy = self.goal
+        g = gy * self.w + gx
+        dist[g] = 0
+        self._relax([(0, g)])
+
+    def _relax(self, heap):
+        """Dijkstra від вузлів у heap: dist(v) = cost(v) + min dist(сусіда)."""
+        w, h, dist, cost = self.w, self.h, self.dist, self.cost
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            vx, vy = i % w, i // w
+            for dx, dy in NEIGHBOURS:
+                nx, ny = vx + dx, vy + dy
+                if 0 <= nx < w and 0 <= ny < h:
+                    j = ny * w + nx
+                    nd = d + cost[j]
+                    if nd < dist[j]:
+                        dist[j] = nd
+                        heapq.heappush(heap, (nd, j))
+
+    # ------------------------------------
+    def _on_tile_changed(self, cx, cy):
+        """Тайл (cx, cy) змінився — перераховуємо 4 вузли навколо нього."""
+        cheaper, dearer = [], False
+        for vx in (cx, cx + 1):
+            for vy in (cy, cy + 1):
+                i = vy * self.w + vx
+                new_cost = self._node_cost(vx, vy)
+                old_cost = self.cost[i]
+                self.cost[i] = new_cost
+                if new_cost > old_cost:
+                    dearer = True
+                elif new_cost < old_cost and (vx, vy) != self.goal:
+                    cheaper.append((vx, vy, i))
+        if dearer:
+            # стало дорожче — рідкість (тайл поставили), простіше перебудувати; вартості всіх 4 вузлів уже оновлені
+            self._build()
+            return
+        heap = []
+        for vx, vy, i in cheaper:
+            nd = min(self._neighbour_dists(vx, vy), default=INF) + self.cost[i]
+            if nd < self.dist[i]:
+                self.dist[i] = nd
+                heap.append((nd, i))
+        if heap:
+            heapq.heapify(heap)
+            self._relax(heap)
+
+    def _neighbour_dists(self, vx, vy):
+        for dx, dy in NEIGHBOURS:
+            nx, ny = vx + dx, vy + dy
+            if 0 <= nx < self.w and 0 <= ny < self.h:
+                yield self.dist[ny * self.w + nx]
+
+    # ------------------------------------
+    def distance(self, x, y):
+        vx, vy = self.node_of(x, y)
+        return self.dist[vy * self.w + vx]
+
+    def next_step(self, x, y):
+        """
+        Напрям (dx, dy) до сусіднього вузла з меншою відстанню, або None (ціль досягнута/недосяжна).
+        Повертає також сам вузол, щоб AI міг вирівнятися по ньому перед поворотом.
+        """
+        vx, vy = self.node_of(x, y)
+        here = self.dist[vy * self.w + vx]
+        best, step = here, None
+        for dx, dy in NEIGHBOURS:
+            nx, ny = vx + dx, vy + dy
+            if 0 <= nx < self.w and 0 <= ny < self.h:
+                d = self.dist[ny * self.w + nx]
+                if d < best:
+                    best, step = d, (dx, dy)
+        if step is None:
+            return None
+        return step, (vx, vy)
@@ -1,32 +1,62 @@
+import os
 import pygame
-from ..entities.block import Block
+from ..services.tile_map import TileMap, BRICK, KIND_COLORS
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "levels")
 
 
 class LevelSystem:
     def __init__(self, tile_size=32):
         self.tile_size = tile_size
-        self.blocks = pygame.sprite.Group()
-        self.tiles = pygame.sprite.Group()
+        self.tilemap = TileMap(0, 0, tile_size)
+        self._layer = None
+
+    def load_level(self, name="level01"):
+        """Завантажує src/data/levels/<name>.txt. Якщо файлу немає — демо-рамка."""
+        path = os.path.join(LEVELS_DIR, f"{name}.txt")
+        if not os.path.exists(path):
+            print(f"[level] Warning: {path} not found. Using demo level.")
+            self.load_demo_level()
+            return
+        self._set_map(TileMap.load(path, self.tile_size))
 
     def load_demo_level(self, w=25, h=18):
-        self.blocks.empty()
         # простенька рамка з цегли
+        tm = TileMap(w, h, self.tile_size)
         for x in range(w):
-            self.blocks.add(Block((x * self.tile_size, 0)))
-            self.blocks.add(Block((x * self.tile_size, (h - 1) * self.tile_size)))
+            tm._set(x, 0, BRICK)
+            tm._set(x, h - 1, BRICK)
         for y in range(h):
-            self.blocks.add(Block((0, y * self.tile_size)))
-            self.blocks.add(Block(((w - 1) * self.tile_size, y * self.tile_size)))
+            tm._set(0, y, BRICK)
+            tm._set(w - 1, y, BRICK)
+        self._set_map(tm)
+
+    def _set_map(self, tilemap):
+        self.tilemap = tilemap
+        self.tilemap.listeners.append(self._repaint_cell)
+        self._layer = pygame.Surface(tilemap.pixel_size, pygame.SRCALPHA)
+        for cy in range(tilemap.rows):
+            for cx in range(tilemap.cols):
+                self._repaint_cell(cx, cy)
+
+    def _repaint_cell(self, cx, cy):
+        """Перемальовує одну клітинку запеченого шару тайлів."""
+        rect = self.tilemap.cell_rect(cx, cy)
+        color = KIND_COLORS.get(self.tilemap.kind_at(cx, cy))
+        self._layer.fill(color or (0, 0, 0, 0), rect)
+
+    def spawn_points(self, symbol, default):
+        """Центри клітинок із символом (P/E/@) з мапи, або default, якщо їх немає."""
+        return self.tilemap.spawns.get(symbol) or default
 
-    def draw(self, screen):
-        self.blocks.draw(screen)
+    def draw(self, screen, area=None):
+        """Запечений шар тайлів; area — лише ця ділянка."""
+        if self._layer:
+            screen.blit(self._layer, area or (0, 0), area)
 
     def check_collision(self, rect: pygame.Rect) -> bool:
         """
         Повертає True, якщо прямокутник впирається у непрохідний тайл.
-        Вважаємо, що у тайла може бути атрибут .solid (за замовчанням True).
+        Відповідь дає TileMap — одна на AI, рух гравця і колізії.
         """
-        for tile in self.tiles:  # якщо у тебе self.blocks — заміни тут і в load_level()
-            if getattr(tile, "solid", True) and tile.rect.colliderect(rect):
-                return True
-        return False
+        return self.tilemap.rect_solid(rect)
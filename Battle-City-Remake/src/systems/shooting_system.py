@@ -1,10 +1,9 @@
 import pygame
-from ..entities.bullet import Bullet
 
 
 class ShootingSystem:
-    def __init__(self, bullets_group, audio=None):
-        self.bullets = bullets_group
+    def __init__(self, bullets, audio=None):
+        self.bullets = bullets        # BulletPool
         self.audio = audio
 
     def shoot(self, shooter):
@@ -15,8 +14,7 @@ class ShootingSystem:
         pos = (shooter.rect.centerx + direction.x * 24,
                shooter.rect.centery + direction.y * 24)
         team = getattr(shooter, "team", "player")  # ← фракція зі стрільця
-        b = Bullet(pos, direction, team=team)
-        self.bullets.add(b)
+        self.bullets.spawn(pos, direction, team=team)
         if hasattr(shooter, "reset_cooldown"):
             shooter.reset_cooldown()
         if self.audio:
@@ -1,126 +1,175 @@
 import pygame
 import random
 import math
+import numpy as np
+
+# Different rock colors
+ROCK_COLORS = [
+    (120, 120, 120),  # Gray
+    (139, 69, 19),    # Brown
+    (105, 105, 105),  # Dim gray
+    (160, 82, 45),    # Saddle brown
+]
+
+# One record per falling rock; color/variant index ROCK_COLORS and the sprite bank
+ROCK_DTYPE = np.dtype([
+    ("x", np.float32), ("y", np.float32), ("speed", np.float32),
+    ("size", np.int16), ("color", np.int8), ("variant", np.int8),
+])
+
 
 class EnemySystem:
+    ROCK_VARIANTS = 4  # pre-rendered shapes per (size, color)
+    _bank = {}         # (size, color index) -> list of ROCK_VARIANTS surfaces
+
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.enemies = []  # List of [x, y, speed, size, color]
+        self.rocks = np.zeros(64, ROCK_DTYPE)  # live rocks are rocks[:count]
+        self.count = 0
         self.spawn_timer = 0
         self.spawn_rate = 1.5  # seconds between spawns
         self.min_speed = 80
         self.max_speed = 200
         self.score = 0
         self.font = pygame.font.SysFont(None, 36)
-        
+        self._score_text = None  # (score, surface), re-rendered only when the score changes
+
+    @classmethod
+    def _variants(cls, size, color):
+        """Rock sprites (irregular polygon, outline, texture lines) rendered once per (size, color)"""
+        key = (size, color)
+        if key not in cls._bank:
+            c = size // 2 + 4  # room for the jitter and the outline
+            sprites = []
+            for _ in range(cls.ROCK_VARIANTS):
+                surf = pygame.Surface((2 * c, 2 * c), pygame.SRCALPHA)
+                points = []
+                for i in range(8):
+                    angle = (i / 8) * 2 * math.pi
+                    radius = size // 2 + random.randint(-3, 3)
+                    points.append((c + int(math.cos(angle) * radius), c + int(math.sin(angle) * radius)))
+                pygame.draw.polygon(surf, ROCK_COLORS[color], points)
+                pygame.draw.polygon(surf, (0, 0, 0), points, 2)
+                pygame.draw.line(surf, (60, 60, 60), (c - size//3, c - size//3), (c + size//3, c + size//3), 1)
+                pygame.draw.line(surf, (60, 60, 60), (c + size//3, c - size//3), (c - size//3, c + size//3), 1)
+                sprites.append(surf)
+            cls._bank[key] = sprites
+        return cls._bank[key]
+
     def spawn_enemy(self):
         """Spawn a new falling rock enemy"""
-        x = random.randint(50, self.screen_width - 50)
-        y = -30  # Start above screen
-        speed = random.randint(self.min_speed, self.max_speed)
+        if self.count == len(self.rocks):
+            grown = np.zeros(len(self.rocks) * 2, ROCK_DTYPE)
+            grown[:self.count] = self.rocks[:self.count]
+            self.rocks = grown
         size = random.randint(15, 35)
-        
-        # Different rock colors
-        colors = [
-            (120, 120, 120),  # Gray
-            (139, 69, 19),    # Brown
-            (105, 105, 105),  # Dim gray
-            (160, 82, 45),    # Saddle brown
-        ]
-        color = random.choice(colors)
-        
-        self.enemies.append([x, y, speed, size, color])
-    
+        color = random.randrange(len(ROCK_COLORS))
+        variant = random.randrange(self.ROCK_VARIANTS)
+        self._variants(size, color)
+        self.rocks[self.count] = (
+            random.randint(50, self.screen_width - 50),  # x
+            -30,                                         # start above screen
+            random.randint(self.min_speed, self.max_speed),
+            size, color, variant,
+        )
+        self.count += 1
+
+    def _remove(self, i):
+        # keep spawn order (it is the draw and hit-test order)
+        self.rocks[i:self.count - 1] = self.rocks[i + 1:self.count]
+        self.count -= 1
+
+    def _hits(self, left, top, right, bottom):
+        """Indices of live rocks whose box overlaps the given box"""
+        r = self.rocks[:self.count]
+        half = r["size"] // 2
+        rl = (r["x"] - half).astype(np.int32)
+        rt = (r["y"] - half).astype(np.int32)
+        return np.flatnonzero((rl < right) & (left < rl + r["size"]) & (rt < bottom) & (top < rt + r["size"]))
+
+    def _record(self, i):
+        x, y, speed, size, color, _ = self.rocks[i].tolist()
+        return (int(x), y, int(speed), size, ROCK_COLORS[color])
+
     def update(self, dt):
         """Update all enemies"""
         self.spawn_timer += dt
-        
+
         # Spawn new enemies
         if self.spawn_timer >= self.spawn_rate:
             self.spawn_enemy()
             self.spawn_timer = 0
-            
+
         # Update enemy positions
-        for enemy in self.enemies[:]:
-            enemy[1] += enemy[2] * dt  # Move down
-            
-            # Remove enemies that fell off screen
-            if enemy[1] > self.screen_height + 50:
-                self.enemies.remove(enemy)
-    
+        r = self.rocks[:self.count]
+        r["y"] += r["speed"] * dt  # Move down
+
+        # Remove enemies that fell off screen
+        keep = r["y"] <= self.screen_height + 50
+        alive = int(np.count_nonzero(keep))
+        if alive != self.count:
+            self.rocks[:alive] = r[keep]
+            self.count = alive
+
     def check_tank_collision(self, tank_rect):
         """Check if any enemy hit the tank"""
-        for enemy in self.enemies[:]:
-            x, y, speed, size, color = enemy
-            enemy_rect = pygame.Rect(x - size//2, y - size//2, size, size)
-            
-            if tank_rect.colliderect(enemy_rect):
-                self.enemies.remove(enemy)
-                return True
+        hits = self._hits(tank_rect.left, tank_rect.top, tank_rect.right, tank_rect.bottom)
+        if len(hits):
+            self._remove(int(hits[0]))
+            return True
         return False
-    
+
     def check_bullet_collision(self, bullets):
         """Check bullet-enemy collisions and update score"""
         hit_enemies = []
-        
+
         for bullet in bullets[:]:
-            bullet_rect = pygame.Rect(int(bullet[0]) - 2, int(bullet[1]) - 2, 4, 8)
-            
-            for enemy in self.enemies[:]:
-                x, y, speed, size, color = enemy
-                enemy_rect = pygame.Rect(x - size//2, y - size//2, size, size)
-                
-                if bullet_rect.colliderect(enemy_rect):
-                    # Remove both bullet and enemy
-                    if bullet in bullets:
-                        bullets.remove(bullet)
-                    self.enemies.remove(enemy)
-                    self.score += 10  # Add 10 points per destroyed rock
-                    hit_enemies.append(enemy)
-                    break
-        
+            bx, by = int(bullet[0]) - 2, int(bullet[1]) - 2
+            hits = self._hits(bx, by, bx + 4, by + 8)
+            if len(hits):
+                # Remove both bullet and enemy
+                i = int(hits[0])
+                if bullet in bullets:
+                    bullets.remove(bullet)
+                hit_enemies.append(self._record(i))
+                self._remove(i)
+                self.score += 10  # Add 10 points per destroyed rock
+
         return hit_enemies
-    
+
     def draw(self, surf):
         """Draw all enemies and score"""
-        # Draw enemies as rocks
-        for enemy in self.enemies:
-            x, y, speed, size, color = enemy
-            
-            # Draw rock shape (irregular polygon)
-            points = []
-            for i in range(8):
-                angle = (i / 8) * 2 * math.pi
-                radius = size // 2 + random.randint(-3, 3)
-                px = x + int(math.cos(angle) * radius)
-                py = y + int(math.sin(angle) * radius)
-                points.append((px, py))
-            
-            pygame.draw.polygon(surf, color, points)
-            pygame.draw.polygon(surf, (0, 0, 0), points, 2)
-            
-            # Add some texture lines
-            pygame.draw.line(surf, (60, 60, 60), (x - size//3, y - size//3), (x + size//3, y + size//3), 1)
-            pygame.draw.line(surf, (60, 60, 60), (x + size//3, y - size//3), (x - size//3, y + size//3), 1)
-        
+        # Draw enemies as rocks: one blit of a pre-rendered variant each
+        bank = self._bank
+        batch = []
+        for x, y, size, color, variant in zip(self.rocks["x"][:self.count].tolist(),
+                                              self.rocks["y"][:self.count].tolist(),
+                                              self.rocks["size"][:self.count].tolist(),
+                                              self.rocks["color"][:self.count].tolist(),
+                                              self.rocks["variant"][:self.count].tolist()):
+            c = size // 2 + 4
+            batch.append((bank[(size, color)][variant], (int(x) - c, int(y) - c)))
+        surf.blits(batch, False)
+
         # Draw score at top center
-        score_text = self.font.render(f"SCORE: {self.score}", True, (255, 255, 0))
+        if self._score_text is None or self._score_text[0] != self.score:
+            self._score_text = (self.score, self.font.render(f"SCORE: {self.score}", True, (255, 255, 0)))
+        score_text = self._score_text[1]
         score_x = self.screen_width // 2 - score_text.get_width() // 2
-        surf.blit(score_text, (score_x, 20))
-        
+
         # Draw score background for better visibility
         score_bg = pygame.Rect(score_x - 10, 15, score_text.get_width() + 20, score_text.get_height() + 10)
         pygame.draw.rect(surf, (0, 0, 0), score_bg, border_radius=8)
         pygame.draw.rect(surf, (255, 255, 0), score_bg, 2, border_radius=8)
         surf.blit(score_text, (score_x, 20))
-    
+
     def reset(self):
         """Reset the enemy system"""
-        self.enemies.clear()
+        self.count = 0
         self.score = 0
         self.spawn_timer = 0
-    
+
     def set_difficulty(self, level):
         """Adjust spawn rate based on difficulty level"""
         if level == 1:
@@ -138,37 +187,101 @@ class EnemySystem:
 
 # Particle effects for destroyed rocks
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []  # [x, y, vx, vy, life, color]
-    
-    def create_explosion(self, x, y, color=(255, 100, 0)):
-        """Create explosion particles when rock is destroyed"""
-        for i in range(8):
-            angle = (i / 8) * 2 * math.pi
-            speed = random.randint(50, 150)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            life = random.uniform(0.3, 0.8)
-            self.particles.append([x, y, vx, vy, life, color])
-    
+    """
+    Particles live in fixed-capacity NumPy arrays; live ones occupy the dense prefix [0, count).
+    Dead particles are swap-removed (the live tail is moved into their slots), so removal is O(dead).
+    Each particle is drawn with a cached pre-rendered alpha circle per (size, alpha bucket, colour),
+    and the whole batch goes through a single Surface.blits call.
+    """
+    MAX_SIZE = 6
+    ALPHA_BUCKETS = 16
+    _sprites = {}  # (size, alpha bucket, colour) -> Surface, shared by all systems
+
+    def __init__(self, capacity=8192):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.color = np.zeros(capacity, np.int32)  # index into self.palette
+        self.palette = []
+        self._palette_index = {}
+
+    def __len__(self):
+        return self.count
+
+    def reset(self):
+        self.count = 0
+
+    def _color_id(self, color):
+        color = tuple(color)
+        if color not in self._palette_index:
+            self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return self._palette_index[color]
+
+    def create_explosion(self, x, y, color=(255, 100, 0), count=8):
+        """Create explosion particles when rock is destroyed (extra ones are dropped when full)"""
+        n = min(count, self.capacity - self.count)
+        if n <= 0:
+            return
+        i, j = self.count, self.count + n
+        angle = np.arange(n, dtype=np.float32) * (2 * math.pi / count)
+        speed = np.random.randint(50, 151, n).astype(np.float32)
+        self.pos[i:j] = (x, y)
+        self.vel[i:j, 0] = np.cos(angle) * speed
+        self.vel[i:j, 1] = np.sin(angle) * speed
+        self.life[i:j] = np.random.uniform(0.3, 0.8, n)
+        self.color[i:j] = self._color_id(color)
+        self.count = j
+
     def update(self, dt):
         """Update particles"""
-        for particle in self.particles[:]:
-            particle[0] += particle[2] * dt  # x
-            particle[1] += particle[3] * dt  # y
-            particle[4] -= dt  # life
-            
-            if particle[4] <= 0:
-                self.particles.remove(particle)
-    
+        n = self.count
+        if not n:
+            return
+        self.pos[:n] += self.vel[:n] * dt
+        self.life[:n] -= dt
+
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if not len(dead):
+            return
+        keep = n - len(dead)
+        holes = dead[dead < keep]                   # dead slots inside the new prefix
+        tail = np.arange(keep, n)
+        tail = tail[self.life[keep:n] > 0]          # live particles past the new end
+        for arr in (self.pos, self.vel, self.life, self.color):
+            arr[holes] = arr[tail]
+        self.count = keep
+
+    def _sprite(self, size, bucket, color):
+        key = (size, bucket, color)
+        spr = self._sprites.get(key)
+        if spr is None:
+            alpha = min(255, int((bucket + 0.5) * 256 / self.ALPHA_BUCKETS))
+            spr = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(spr, (*color, alpha), (size, size), size)
+            self._sprites[key] = spr
+        return spr
+
     def draw(self, surf):
         """Draw particles"""
-        for particle in self.particles:
-            x, y, vx, vy, life, color = particle
-            alpha = int(life * 255)
-            size = max(1, int(life * 6))
-            
-            # Create surface with alpha for fading effect
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
-            surf.blit(particle_surf, (x - size, y - size))
\ No newline at end of file
+        n = self.count
+        if not n:
+            return
+        life = self.life[:n]
+        size = np.clip((life * 6).astype(np.int32), 1, self.MAX_SIZE)
+        bucket = np.clip((life * 255).astype(np.int32) * self.ALPHA_BUCKETS // 256, 0, self.ALPHA_BUCKETS - 1)
+        key = (self.color[:n] * (self.MAX_SIZE + 1) + size) * self.ALPHA_BUCKETS + bucket
+        table = {}
+        for k in np.unique(key).tolist():
+            b = k % self.ALPHA_BUCKETS
+            s = (k // self.ALPHA_BUCKETS) % (self.MAX_SIZE + 1)
+            c = self.palette[k // self.ALPHA_BUCKETS // (self.MAX_SIZE + 1)]
+            table[k] = (self._sprite(s, b, c), s)
+        xy = self.pos[:n].astype(np.int32).tolist()
+        batch = []
+        for k, (x, y) in zip(key.tolist(), xy):
+            spr, s = table[k]
+            batch.append((spr, (x - s, y - s)))
+        surf.blits(batch, False)
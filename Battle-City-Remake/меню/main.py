@@ -570,26 +570,6 @@ class Credits(Scene):
             surf.blit(txt, (surf.get_width() // 2 - txt.get_width() // 2, y))
             y += 50
         self.btn_back.draw(surf)
-class ParticleSystem:
-    def __init__(self):
-        self.particles = []          # пока что пустой список частиц
-
-    def reset(self):
-        """Очистить все партиклы при перезапуске уровня."""
-        self.particles.clear()
-
-    def update(self, dt):
-        # заглушка, если пока не реализовываете
-        pass
-
-    def draw(self, surf):
-        # заглушка
-        pass
-
-    def create_explosion(self, x, y, color):
-        # заглушка; при желании добавьте простые кружочки
-        pass
-
 # ------------------------------ GAME SCENE ------------------------------
 class Game(Scene):
     def __init__(self, mgr):
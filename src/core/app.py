@@ -21,7 +21,7 @@ class App:
         self.screen = pygame.display.set_mode((C.WIDTH, C.HEIGHT))
         pygame.display.set_caption(C.TITLE)
         self.clock = pygame.time.Clock()
-        self.time = Time()
+        self.time = Time(1 / C.SIM_HZ, C.MAX_STEPS)
         self.bus = EventBus()
         self.assets = Assets()
         self.audio = Audio()
@@ -29,6 +29,7 @@ class App:
         self.physics = Physics()
         self.ui = UI(self.assets)
         self.running = True
+        self._presented = None      # сцена, чий кадр зараз на екрані
         self.scene = MenuScene(self)
         self.scene.enter()
 
@@ -42,16 +43,33 @@ class App:
             self.input.update(events)
             self.scene.handle_events(events)
 
-            self.time.update(self.clock)
-            self.scene.update()
+            # фіксований крок: 0..MAX_STEPS оновлень за кадр, рендер інтерполює між ними (time.alpha)
+            for _ in range(self.time.update(self.clock)):
+                self.scene.update()
 
-            self.screen.fill((20, 20, 24))
-            self.scene.render(self.screen)
-            pygame.display.flip()
+            self.present()
             self.clock.tick(C.FPS)
 
         pygame.quit()
 
+    def present(self):
+        """
+        Перший кадр сцени — повний (fill + render + flip). Далі, якщо сцена підтримує render_dirty,
+        оновлюються лише змінені прямокутники; коли їх площа завелика — все одно один flip.
+        """
+        rects = None
+        if C.DIRTY_RENDERING and self.scene is self._presented:
+            rects = self.scene.render_dirty(self.screen)
+        self._presented = self.scene
+        if rects is None:
+            self.screen.fill(C.BG_COLOR)
+            self.scene.render(self.screen)
+            pygame.display.flip()
+        elif sum(r.w * r.h for r in rects) > C.DIRTY_AREA_LIMIT * C.WIDTH * C.HEIGHT:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
     def change_scene(self, scene_cls, **kwargs):
         self.scene.exit()
         self.scene = scene_cls(self)
@@ -0,0 +1,42 @@
+"""
+Камера: прямокутник огляду у світових координатах, що стежить за ціллю (гравцем) і не виходить за межі карти.
+Перетворює світові координати в екранні та відсікає все, що поза оглядом, ще до blit — вартість рендера залежить від розміру вікна, а не карти.
+Якщо карта вміщується у вікно по якійсь осі, LevelSystem уже відцентрував її у вікні — по цій осі камера лишається в 0.
+"""
+import pygame
+
+class Camera:
+    def __init__(self, size, world: pygame.Rect):
+        self.view = pygame.Rect((0, 0), size)
+        self.world = pygame.Rect(world)
+        self.follow(self.world)
+
+    @property
+    def offset(self):
+        return self.view.topleft
+
+    @property
+    def scrolled(self) -> bool:
+        """Чи зсунута камера від (0, 0) — тоді світові координати не збігаються з екранними."""
+        return self.view.topleft != (0, 0)
+
+    def follow(self, target: pygame.Rect):
+        """Центрує огляд на target, притискаючи його до меж карти."""
+        v, w = self.view, self.world
+        if w.width <= v.width:
+            v.x = 0
+        else:
+            v.centerx = target.centerx
+            v.clamp_ip(w.left, v.top, w.width, v.height)
+        if w.height <= v.height:
+            v.y = 0
+        else:
+            v.centery = target.centery
+            v.clamp_ip(v.left, w.top, v.width, w.height)
+
+    def visible(self, rect: pygame.Rect) -> bool:
+        return self.view.colliderect(rect)
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """Світовий rect -> екранний."""
+        return rect.move(-self.view.x, -self.view.y)
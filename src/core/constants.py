@@ -1,7 +1,15 @@
 TITLE = "Battle City (Prototype)"
 WIDTH, HEIGHT = 832, 768         # 26x24 тайлів ~32px
-FPS = 60
+FPS = 60                         # частота рендера
+SIM_HZ = 60                      # частота симуляції: update завжди отримує крок 1/SIM_HZ
+MAX_STEPS = 5                    # стільки кроків максимум доганяємо за кадр, решту відкидаємо
 TILE = 32
+BG_COLOR = (20, 20, 24)
+
+# рендер брудними прямокутниками: display.update(rects) замість flip,
+# поки змінена площа менша за цю частку вікна
+DIRTY_RENDERING = True
+DIRTY_AREA_LIMIT = 0.4
 
 # шари рендера (від меншого до більшого)
 LAYER_BG = 0
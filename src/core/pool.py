@@ -0,0 +1,40 @@
+"""
+Пул об’єктів для Entity-підкласів, що народжуються в гарячих місцях (кулі, вибухи, бонуси): acquire() видає об’єкт із вільного списку або створює новий, kill() повертає його в пул.
+Лічильники hits/misses показують, скільки разів пул обійшовся без нової алокації.
+"""
+
+class Pool:
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+
+    def prewarm(self, count, *args, **kwargs):
+        """Заздалегідь створює count об’єктів (наприклад, при вході в сцену)."""
+        for _ in range(count):
+            obj = self.cls(*args, **kwargs)
+            obj._pool = self
+            obj._pooled = True
+            self._free.append(obj)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            obj._pool = self
+            self.misses += 1
+        obj._pooled = False
+        return obj
+
+    def release(self, obj):
+        if not obj._pooled:
+            obj._pooled = True
+            self._free.append(obj)
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
@@ -12,3 +12,7 @@ class Scene:
     def handle_events(self, events): ...
     def update(self): ...
     def render(self, screen: pygame.Surface): ...
+
+    def render_dirty(self, screen: pygame.Surface):
+        """Частковий кадр поверх попереднього: список змінених Rect або None, якщо сцена вміє лише повний render."""
+        return None
@@ -1,18 +1,79 @@
 """
-Узгодження часу кадру: дельта-час, таймери перезарядки/ефектів, планувальник відкладених подій (наприклад, інвертований контроль на льоду).
+Узгодження часу кадру: фіксований крок симуляції з акумулятором і альфою інтерполяції для рендера, таймери перезарядки/ефектів, планувальник відкладених подій (наприклад, інвертований контроль на льоду).
+ThinkScheduler розносить «думання» AI по кадрах: по колу, з бюджетом у мікросекундах на кадр.
 """
+from time import perf_counter_ns
 
 class Time:
-    def __init__(self):
-        self.dt = 0.0
+    """
+    Кадрова дельта накопичується в _lag; сцена оновлюється стільки разів, скільки цілих кроків step набралося — не більше max_steps,
+    решта боргу відкидається, щоб повільний кадр не тягнув за собою ще повільніший.
+    dt — завжди step, тож симуляція однакова при будь-якій частоті кадрів; alpha — залишок кроку (0..1) для інтерполяції рендера.
+    """
+    def __init__(self, step=1 / 60, max_steps=5):
+        self.step = step
+        self.max_steps = max_steps
+        self.dt = step
+        self.frame_dt = 0.0
+        self.alpha = 0.0
+        self._lag = 0.0
         self._accum = 0.0
 
-    def update(self, clock):
-        self.dt = clock.get_time() / 1000.0
-        self._accum += self.dt
+    def update(self, clock) -> int:
+        """Додає дельту кадру; повертає, скільки кроків симуляції виконати цього кадру."""
+        self.frame_dt = clock.get_time() / 1000.0
+        self._lag += self.frame_dt
+        steps = min(int(self._lag / self.step), self.max_steps)
+        self._lag -= steps * self.step
+        if self._lag >= self.step:      # не встигаємо — борг понад max_steps відкидаємо
+            self._lag %= self.step
+        self._accum += steps * self.step
+        self.alpha = self._lag / self.step
+        return steps
 
     def every(self, seconds: float) -> bool:
         if self._accum >= seconds:
             self._accum = 0.0
             return True
         return False
+
+class ThinkScheduler:
+    """
+    Кожного кадру викликає think(agent, elapsed) лише для агентів, чия черга настала (period(agent) секунд від минулого разу),
+    по колу від місця, де зупинився минулий кадр, поки не вичерпано budget_us.
+    Бюджет перевіряється після кожного рішення: розпочате рішення завжди доходить до кінця, тож перший, чия черга настала, думає навіть понад бюджет.
+    Якщо ні в кого черга не настала, цього кадру ніхто не думає (thinks == 0).
+    elapsed — ігровий час від попереднього рішення цього агента, щоб його таймери йшли правильно.
+    """
+    def __init__(self, budget_us=500):
+        self.budget_us = budget_us
+        self.now = 0.0
+        self.thinks = 0             # скільки агентів подумало минулого кадру
+        self._last = {}             # агент -> час останнього рішення
+        self._cursor = 0
+
+    def run(self, agents, dt, think, period=lambda agent: 0.0):
+        self.now += dt
+        self.thinks = 0
+        agents = list(agents)
+        n = len(agents)
+        if not n:
+            return
+        if len(self._last) > n:     # загиблі агенти
+            alive = set(agents)
+            self._last = {a: t for a, t in self._last.items() if a in alive}
+        start = perf_counter_ns()
+        limit = self.budget_us * 1000
+        first = self._cursor % n
+        for k in range(n):
+            i = (first + k) % n
+            agent = agents[i]
+            last = self._last.get(agent)
+            if last is not None and self.now - last < period(agent):
+                continue
+            think(agent, dt if last is None else self.now - last)
+            self._last[agent] = self.now
+            self.thinks += 1
+            self._cursor = i + 1
+            if perf_counter_ns() - start > limit:
+                break
@@ -1,16 +1,96 @@
 """
 Спільні поля та поведінки для всіх ігрових об’єктів: позиція, розмір, шар рендеру, життєвий цикл (активний/видимий), доступ до сервісів, підписка на події.
 """
+import math
 import pygame
 from ..core import constants as C
+from ..services.assets import direction_index
 
-class Entity(pygame.sprite.Sprite):
+class Entity(pygame.sprite.DirtySprite):
     def __init__(self, image, pos, layer=C.LAYER_ENTITIES, tag="entity"):
         super().__init__()
+        self.dirty = 2          # для LayeredDirty: перемальовувати щокадру (сутності рухаються)
         self.image = image
         self.rect = self.image.get_rect(topleft=pos)
+        self.pos = pygame.Vector2(self.rect.topleft)   # точна позиція (дробова); rect.topleft — її ціла частина
+        self.prev = None        # topleft на початку кроку симуляції — для інтерполяції рендера
         self.tag = tag
         self.layer = layer
         self.alive = True
+        self._pool = None       # Pool, якщо об’єкт узято з пулу
+        self._pooled = False
+        self.sprites = None     # банк [поворот][кадр] з Assets.directional, якщо сутність повертається
+        self.facing = 0
+        self.frame = 0
+        self.frame_time = 0.1
+        self._anim = 0.0
+
+    def reset(self, image, pos):
+        """Повторна ініціалізація об’єкта з пулу без нових алокацій."""
+        self.image = image
+        self.rect.size = image.get_size()
+        self.rect.topleft = pos
+        self.pos.update(self.rect.topleft)
+        self.prev = None
+        self.alive = True
+
+    def sync_pos(self):
+        """Якщо rect зсунули напряму (межі карти, розштовхування, поворот спрайта) — точна позиція йде за ним."""
+        if (math.floor(self.pos.x), math.floor(self.pos.y)) != self.rect.topleft:
+            self.pos.update(self.rect.topleft)
+
+    def move_by(self, dx, dy):
+        """Дробовий зсув без колізій: накопичується в pos, rect отримує цілі пікселі."""
+        self.sync_pos()
+        self.pos.x += dx
+        self.pos.y += dy
+        self.rect.topleft = (math.floor(self.pos.x), math.floor(self.pos.y))
+
+    def remember(self):
+        self.prev = self.rect.topleft
+
+    def lerp_rect(self, alpha):
+        """Прямокутник між позицією на початку кроку і поточною: alpha=0 — prev, alpha=1 — rect."""
+        if self.prev is None or self.prev == self.rect.topleft:
+            return self.rect
+        k = 1.0 - alpha
+        return self.rect.move(round((self.prev[0] - self.rect.x) * k), round((self.prev[1] - self.rect.y) * k))
+
+    def set_sprites(self, sprites, direction=(0, -1)):
+        self.sprites = sprites
+        self.facing = direction_index(direction)
+        self.frame = 0
+        self._swap()
+
+    def face(self, direction):
+        """Поворот — це лише інший індекс у банку спрайтів, без transform.rotate у циклі кадру."""
+        if self.sprites is None:
+            return
+        facing = direction_index(direction, self.facing)
+        if facing != self.facing:
+            self.facing = facing
+            self._swap()
+
+    def animate(self, dt):
+        if self.sprites is None or len(self.sprites[self.facing]) < 2:
+            return
+        self._anim += dt
+        if self._anim >= self.frame_time:
+            self._anim %= self.frame_time
+            self.frame = (self.frame + 1) % len(self.sprites[self.facing])
+            self._swap()
+
+    def _swap(self):
+        img = self.sprites[self.facing][self.frame]
+        if img.get_size() != self.rect.size:
+            center = self.rect.center
+            self.rect.size = img.get_size()
+            self.rect.center = center
+        self.image = img
+
+    def kill(self):
+        super().kill()
+        if self._pool is not None:
+            self._pool.release(self)
 
     def update(self, dt): ...
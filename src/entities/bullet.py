@@ -6,12 +6,22 @@ from .base import Entity
 from ..core import constants as C
 
 class Bullet(Entity):
-    def __init__(self, image, pos, direction, speed=300, owner_tag="player"):
-        super().__init__(image, pos, layer=C.LAYER_BULLETS, tag="bullet")
+    def __init__(self, sprites, pos, direction, speed=300, owner_tag="player"):
+        super().__init__(sprites[0][0], pos, layer=C.LAYER_BULLETS, tag="bullet")
+        self.set_sprites(sprites, direction)
         self.dir = pygame.Vector2(direction)
         self.speed = speed
         self.owner_tag = owner_tag
+        self.prev_center = self.rect.center   # звідки куля летіла цього кадру (для DDA)
+
+    def reset(self, sprites, pos, direction, speed=300, owner_tag="player"):
+        super().reset(sprites[0][0], pos)
+        self.set_sprites(sprites, direction)
+        self.dir.update(direction)
+        self.speed = speed
+        self.owner_tag = owner_tag
+        self.prev_center = self.rect.center
 
     def update(self, dt):
-        self.rect.x += int(self.dir.x * self.speed * dt)
-        self.rect.y += int(self.dir.y * self.speed * dt)
+        self.prev_center = self.rect.center
+        self.move_by(self.dir.x * self.speed * dt, self.dir.y * self.speed * dt)
@@ -14,19 +14,25 @@ DIRECTIONS = [
 ]
 
 class Enemy(Entity):
-    def __init__(self, image, pos, speed=90):
-        super().__init__(image, pos, layer=C.LAYER_ENTITIES, tag="enemy")
+    def __init__(self, sprites, pos, speed=90):
+        super().__init__(sprites[0][0], pos, layer=C.LAYER_ENTITIES, tag="enemy")
         self.speed = speed
         self.dir = pygame.Vector2(0, 1)
+        self.set_sprites(sprites, self.dir)
         self.turn_cd = 0.0
         self.reload = 1.0
         self.cool = 0.0
+        self.state = "patrol"       # patrol / pursue
+        self.waypoint = None        # верхній лівий кут наступної клітинки шляху (переслідування)
+        self.pursue_chance = 0.5
 
     def decide(self, dt):
         self.turn_cd -= dt
         if self.turn_cd <= 0:
             self.turn_cd = random.uniform(0.7, 1.6)
-            self.dir = random.choice(DIRECTIONS)  # ← тепер завжди Vector2
+            self.state = "pursue" if random.random() < self.pursue_chance else "patrol"
+            if self.state == "patrol":
+                self.dir = random.choice(DIRECTIONS)  # ← тепер завжди Vector2
 
         self.cool = max(0.0, self.cool - dt)
 
@@ -35,3 +41,7 @@ class Enemy(Entity):
 
     def shot_fired(self):
         self.cool = self.reload
+
+    def update(self, dt):
+        self.face(self.dir)
+        self.animate(dt)
@@ -9,3 +9,7 @@ class PowerUp(Entity):
     def __init__(self, image, pos, kind="shield"):
         super().__init__(image, pos, layer=C.LAYER_ENTITIES, tag="powerup")
         self.kind = kind
+
+    def reset(self, image, pos, kind="shield"):
+        super().reset(image, pos)
+        self.kind = kind
@@ -6,13 +6,14 @@ from .base import Entity
 from ..core import constants as C
 
 class Tank(Entity):
-    def __init__(self, image, pos, speed=120, tag="player"):
-        super().__init__(image, pos, layer=C.LAYER_ENTITIES, tag=tag)
+    def __init__(self, sprites, pos, speed=120, tag="player"):
+        super().__init__(sprites[0][0], pos, layer=C.LAYER_ENTITIES, tag=tag)
         self.speed = speed
         self.reload = 0.4
         self._cooldown = 0.0
         self.direction = pygame.Vector2(0, -1)
         self.hp = 3
+        self.set_sprites(sprites, self.direction)
 
     def handle_input(self, inp):
         v = pygame.Vector2(0, 0)
@@ -38,3 +39,5 @@ class Tank(Entity):
     def update(self, dt):
         if self._cooldown > 0:
             self._cooldown -= dt
+        self.face(self.direction)
+        self.animate(dt)
@@ -4,28 +4,43 @@
 import pygame
 from ..core.scene import Scene
 from ..core import constants as C
-from ..systems.level_system import LevelSystem
+from ..core.camera import Camera
+from ..systems.level_system import LevelSystem, LEVEL_MAP
 from ..systems.collision_system import CollisionSystem
 from ..systems.shooting_system import ShootingSystem
 from ..systems.ai_system import AISystem
+from ..services.pathfinding import Pathfinder
 from .pause_scene import PauseScene
 
 class GameScene(Scene):
     def enter(self, **kwargs):
+        self.level_map = kwargs.get("level_map", LEVEL_MAP)
         self.level = LevelSystem(self.app.assets)
-        self.player, self.enemies, self.blocks, self.eagle, self.bounds = self.level.build()
-        self.all_sprites = pygame.sprite.LayeredUpdates()
+        self.player, self.enemies, self.blocks, self.eagle, self.bounds = self.level.build(self.level_map)
+        self.camera = Camera((C.WIDTH, C.HEIGHT), self.bounds)
+        self.camera.follow(self.player.rect)
+        self.all_sprites = pygame.sprite.LayeredDirty()
         self.bullets = pygame.sprite.Group()
 
-        for b in self.blocks: self.all_sprites.add(b, layer=b.layer)
         for e in self.enemies: self.all_sprites.add(e, layer=e.layer)
         if self.eagle: self.all_sprites.add(self.eagle, layer=self.eagle.layer)
         self.all_sprites.add(self.player, layer=self.player.layer)
 
-        self.collision = CollisionSystem(self.app.physics)
+        self.collision = CollisionSystem(self.app.physics, self.level.tiles)
+        self.collision.track(*self.enemies, self.player, self.eagle)
         self.shooting = ShootingSystem(self.app.assets)
-        self.ai = AISystem(self.app.physics)
-        self.font = pygame.font.SysFont("Arial", 28)
+        self.ai = AISystem(self.app.physics, Pathfinder(self.level.tiles))
+        self.font = self.app.ui.font("Arial", 28)
+
+        # фон для LayeredDirty: заливка + запечені тайли; зруйнований тайл латається в ньому
+        self.background = pygame.Surface((C.WIDTH, C.HEIGHT))
+        self.background.fill(C.BG_COLOR)
+        self.level.draw(self.background)
+        self.all_sprites.clear(self.app.screen, self.background)
+        self.all_sprites.repaint_rect(self.background.get_rect())   # після (пере)входу — повний кадр
+        self.level.tiles.listeners.append(self._on_tile_changed)
+        self._hud_rects = []
+        self._scrolled = False      # минулий кадр малювався з прокруткою — брудні прямокутники не чинні
 
         self.state = "playing"      # playing / gameover / win
         self.timer = 0.0            # таймер після перемоги або поразки
@@ -37,18 +52,20 @@ class GameScene(Scene):
 
     def update(self):
         dt = self.app.time.dt
+        for s in self.all_sprites:
+            s.remember()
 
         # якщо перемога або поразка — рахуємо таймер
         if self.state in ("gameover", "win"):
             self.timer += dt
             if self.timer > 2.0:      # через 2 секунди перезапуск
-                self.enter()
+                self.enter(level_map=self.level_map)
             return
 
         # --- рух гравця ---
         v = self.player.handle_input(self.app.input)
-        dx, dy = int(v.x * self.player.speed * dt), int(v.y * self.player.speed * dt)
-        self.app.physics.move_and_collide(self.player, dx, dy, self.blocks)
+        dx, dy = v.x * self.player.speed * dt, v.y * self.player.speed * dt
+        self.app.physics.move_and_collide(self.player, dx, dy, self.level.tiles)
 
         # межі карти
         if not self.bounds.contains(self.player.rect):
@@ -59,15 +76,15 @@ class GameScene(Scene):
 
         # стрільба
         if self.app.input.pressed("fire"):
-            self.shooting.player_try_shoot(self.player, self.bullets)
+            self.shooting.player_try_shoot(self.player, (self.bullets, self.all_sprites))
 
         # рух і стрільба ворогів
-        self.ai.update(dt, self.enemies, self.blocks, self.bounds)
+        self.ai.update(dt, self.enemies, self.level.tiles, self.bounds, target=self.player)
         for e in self.enemies:
-            self.shooting.enemy_try_shoot(e, self.bullets)
+            self.shooting.enemy_try_shoot(e, (self.bullets, self.all_sprites), self.level.tiles, (self.player, self.eagle))
 
-        # апдейти куль
-        for b in list(self.bullets): b.update(dt)
+        # апдейти куль і таймерів сутностей
+        self.all_sprites.update(dt)
 
         # перевірка колізій
         self.collision.update(self.player, self.enemies, self.bullets, self.blocks, self.eagle, self._on_event)
@@ -77,8 +94,6 @@ class GameScene(Scene):
             self.state = "win"
             self.timer = 0.0
 
-        self.all_sprites.update(dt)
-
     def _on_event(self, name):
         if name == "eagle_down":
             self.state = "gameover"
@@ -87,20 +102,68 @@ class GameScene(Scene):
             self.state = "gameover"
             self.timer = 0.0
 
-    def render(self, screen):
-        self.all_sprites.draw(screen)
-        for b in self.bullets:
-            screen.blit(b.image, b.rect)
+    def _on_tile_changed(self, cx, cy):
+        r = self.level.tiles.cell_rect(cx, cy)
+        self.background.fill(C.BG_COLOR, r)
+        self.level.draw(self.background, r)
+        self.all_sprites.repaint_rect(r)
 
-        # HP лічильник
-        hp_text = self.font.render(f"HP: {self.player.hp}", True, (255, 255, 255))
-        screen.blit(hp_text, (20, 20))
+    def render(self, screen):
+        alpha = self.app.time.alpha
+        self.camera.follow(self.player.lerp_rect(alpha))
+        self._scrolled = self.camera.scrolled
+        if self._scrolled:
+            self._render_scrolled(screen, alpha)
+        else:
+            self.all_sprites.repaint_rect(screen.get_rect())   # фон (заливка + тайли) під усім кадром
+            self._draw_sprites(screen, alpha)
+        self._hud_rects = self._draw_hud(screen)
+
+    def _render_scrolled(self, screen, alpha):
+        """Кадр із прокруткою: лише видима ділянка тайлів і спрайти, що перетинають огляд камери."""
+        cam = self.camera
+        self.level.draw(screen, camera=cam)
+        visible = []
+        for s in self.all_sprites.sprites():
+            r = s.lerp_rect(alpha)
+            if cam.visible(r):
+                visible.append((s.image, cam.apply(r)))
+        screen.blits(visible, False)
+
+    def _draw_sprites(self, screen, alpha):
+        """LayeredDirty.draw на інтерпольованих позиціях: rect підміняється лише на час малювання."""
+        moved = [(s, s.rect) for s in self.all_sprites if s.prev is not None and s.prev != s.rect.topleft]
+        for s, _ in moved:
+            s.rect = s.lerp_rect(alpha)
+        rects = self.all_sprites.draw(screen)
+        for s, rect in moved:
+            s.rect = rect
+        return rects
+
+    def render_dirty(self, screen):
+        # брудні прямокутники — у світових координатах, тож лише поки камера в (0, 0)
+        self.camera.follow(self.player.lerp_rect(self.app.time.alpha))
+        scrolled, self._scrolled = self._scrolled, self.camera.scrolled
+        if scrolled or self._scrolled:
+            return None
+        for r in self._hud_rects:       # минулий HUD стирається фоном
+            self.all_sprites.repaint_rect(r)
+        rects = self._draw_sprites(screen, self.app.time.alpha)
+        self._hud_rects = self._draw_hud(screen)
+        return rects + self._hud_rects
+
+    def _draw_hud(self, screen):
+        ui = self.app.ui
+        # HP лічильник: підпис із кешу, число — з гліфів цифр
+        label = screen.blit(ui.label(self.font, "HP: ", (255, 255, 255)), (20, 20))
+        rects = [label, ui.digits(self.font, (255, 255, 255)).draw(screen, label.topright, self.player.hp)]
 
         # повідомлення про стан
         if self.state == "gameover":
-            msg = self.font.render("GAME OVER", True, (255, 80, 80))
-            screen.blit(msg, msg.get_rect(center=(C.WIDTH // 2, 50)))
+            msg = ui.label(self.font, "GAME OVER", (255, 80, 80))
+            rects.append(screen.blit(msg, msg.get_rect(center=(C.WIDTH // 2, 50))))
 
         elif self.state == "win":
-            msg = self.font.render("LEVEL CLEAR!", True, (100, 255, 100))
-            screen.blit(msg, msg.get_rect(center=(C.WIDTH // 2, 50)))
+            msg = ui.label(self.font, "LEVEL CLEAR!", (100, 255, 100))
+            rects.append(screen.blit(msg, msg.get_rect(center=(C.WIDTH // 2, 50))))
+        return rects
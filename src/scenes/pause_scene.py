@@ -1,5 +1,6 @@
 """
 Оверлей з варіантами «Продовжити», «Вийти в меню». Повертає керування в game_scene або робить перехід у menu_scene.
+Кадр гри знімається один раз на вході (вже затемнений і з написом), далі пауза нічого не перемальовує.
 """
 
 import pygame
@@ -8,7 +9,13 @@ from ..core.scene import Scene
 class PauseScene(Scene):
     def enter(self, **kwargs):
         self.prev = kwargs["prev_scene"]
-        self.font = pygame.font.SysFont("Arial", 48)
+        self.font = self.app.ui.font("Arial", 48)
+        # на екрані ще останній кадр гри — знімок із затемненням і написом
+        screen = self.app.screen
+        self.snapshot = screen.copy()
+        self.snapshot.fill((110, 110, 110), special_flags=pygame.BLEND_MULT)
+        txt = self.app.ui.label(self.font, "PAUSE", (255, 255, 255))
+        self.snapshot.blit(txt, txt.get_rect(center=(screen.get_width()//2, 100)))
 
     def handle_events(self, events):
         for e in events:
@@ -16,6 +23,7 @@ class PauseScene(Scene):
                 self.app.change_scene(type(self.prev))
 
     def render(self, screen):
-        self.prev.render(screen)
-        txt = self.font.render("PAUSE", True, (255, 255, 255))
-        screen.blit(txt, txt.get_rect(center=(screen.get_width()//2, 100)))
+        screen.blit(self.snapshot, (0, 0))
+
+    def render_dirty(self, screen):
+        return []
@@ -22,6 +22,18 @@ COLORS = {
     "powerup": (240, 120, 240),
 }
 
+# індекси поворотів у directional(): вихідний спрайт дивиться вгору, далі — проти годинникової стрілки
+UP, LEFT, DOWN, RIGHT = range(4)
+
+def direction_index(v, default=UP):
+    """Індекс повороту для вектора напряму (домінуюча вісь); для нульового — default."""
+    x, y = v
+    if x == 0 and y == 0:
+        return default
+    if abs(x) > abs(y):
+        return RIGHT if x > 0 else LEFT
+    return DOWN if y > 0 else UP
+
 class Assets:
     def __init__(self):
         self._cache = {}
@@ -43,3 +55,25 @@ class Assets:
     def animation(self, key: str, frames: int, size=(32, 32)):
         """Повертає список кадрів-заглушок (для вибуху/анім.руху)."""
         return [self.image(key, size=size) for _ in range(frames)]
+
+    def directional(self, key: str, frames: int = 1, size=(32, 32)):
+        """
+        Банк спрайтів [поворот][кадр]: 4 повороти (UP, LEFT, DOWN, RIGHT) × frames кадрів анімації.
+        Обертання робиться тут один раз при завантаженні; сутності лише перемикають індекс.
+        """
+        cache_key = ("directional", key, frames, tuple(size))
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        source = self.animation(key, frames, size=size)
+        rotated = {}
+        bank = []
+        for facing in (UP, LEFT, DOWN, RIGHT):
+            row = []
+            for surf in source:
+                k = (id(surf), facing)
+                if k not in rotated:
+                    rotated[k] = surf if facing == UP else pygame.transform.rotate(surf, 90 * facing)
+                row.append(rotated[k])
+            bank.append(row)
+        self._cache[cache_key] = bank
+        return bank
@@ -0,0 +1,109 @@
+"""
+Пошук шляху A* по сітці тайлів рівня (4 напрямки, цегла непрохідна). Шляхи кешуються за (старт, ціль) і спільні для всіх ворогів: суфікс уже знайденого оптимального шляху — теж оптимальний, тож ворог, що стоїть на чужому шляху до тієї ж цілі, отримує його без пошуку.
+Коли клітинка змінюється, інвалідуються лише шляхи, що проходять через неї або повз неї (ті, що могли б через неї зрізати).
+"""
+import heapq
+from collections import OrderedDict, defaultdict
+
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+class Pathfinder:
+    def __init__(self, tiles, max_cached=256):
+        self.tiles = tiles
+        self.max_cached = max_cached
+        self._cache = OrderedDict()          # (start, goal) -> [клітинки] або None
+        self._by_cell = defaultdict(set)     # клітинка -> ключі шляхів, яких вона стосується
+        self._on_path = defaultdict(dict)    # goal -> {клітинка: (ключ, індекс у шляху)}
+        self._unreachable = set()            # ключі з результатом None
+        self.hits = 0
+        self.misses = 0
+        tiles.listeners.append(self.invalidate_cell)
+
+    def find(self, start, goal):
+        """Шлях від start до goal включно (список клітинок) або None, якщо цілі не дістатися."""
+        key = (start, goal)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+
+        shared = self._on_path[goal].get(start)
+        if shared is not None:
+            other, i = shared
+            self.hits += 1
+            path = self._cache[other][i:]
+            self._store(key, path)
+            return path
+
+        self.misses += 1
+        path = self._astar(start, goal)
+        self._store(key, path)
+        return path
+
+    # ------------------------------------
+    def _astar(self, start, goal):
+        tiles = self.tiles
+        if tiles.is_solid(*goal) or not tiles.in_bounds(*goal):
+            return None
+        gx, gy = goal
+        came = {start: None}
+        cost = {start: 0}
+        heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start)]
+        while heap:
+            _, g, cur = heapq.heappop(heap)
+            if cur == goal:
+                path = []
+                while cur is not None:
+                    path.append(cur)
+                    cur = came[cur]
+                path.reverse()
+                return path
+            if g > cost[cur]:
+                continue
+            cx, cy = cur
+            for dx, dy in NEIGHBOURS:
+                nxt = (cx + dx, cy + dy)
+                if not tiles.in_bounds(*nxt) or tiles.is_solid(*nxt):
+                    continue
+                ng = g + 1
+                if ng < cost.get(nxt, ng + 1):
+                    cost[nxt] = ng
+                    came[nxt] = cur
+                    h = abs(nxt[0] - gx) + abs(nxt[1] - gy)
+                    heapq.heappush(heap, (ng + h, ng, nxt))
+        return None
+
+    def _store(self, key, path):
+        self._cache[key] = path
+        if path is None:
+            self._unreachable.add(key)
+        else:
+            on_path = self._on_path[key[1]]
+            for i, (cx, cy) in enumerate(path):
+                on_path.setdefault((cx, cy), (key, i))
+                self._by_cell[(cx, cy)].add(key)
+                for dx, dy in NEIGHBOURS:
+                    self._by_cell[(cx + dx, cy + dy)].add(key)
+        while len(self._cache) > self.max_cached:
+            self._drop(next(iter(self._cache)))
+
+    def _drop(self, key):
+        path = self._cache.pop(key, None)
+        self._unreachable.discard(key)
+        if path is None:
+            return
+        on_path = self._on_path[key[1]]
+        for cx, cy in path:
+            if on_path.get((cx, cy), (None,))[0] == key:
+                del on_path[(cx, cy)]
+            for dx, dy in ((0, 0),) + NEIGHBOURS:
+                keys = self._by_cell.get((cx + dx, cy + dy))
+                if keys is not None:
+                    keys.discard(key)
+
+    def invalidate_cell(self, cx, cy):
+        """Клітинка змінилась: скидаємо шляхи, що її стосуються, і всі «недосяжні» відповіді."""
+        for key in list(self._by_cell.pop((cx, cy), ())):
+            self._drop(key)
+        for key in list(self._unreachable):
+            self._drop(key)
@@ -1,23 +1,48 @@
 """
 Низькорівневі операції: AABB-колізії, рух з урахуванням тайлів (брик/стік), проникність об’єктів (куль), ковзання по льоду.
+Зсуви дробові: точна позиція живе в Entity.pos, rect рухається на цілі пікселі, тож повільний рух не губиться на високій частоті кроків.
 """
+import math
 import pygame
 
 class Physics:
     @staticmethod
-    def move_and_collide(sprite, dx, dy, blockers):
-        """Просте AABB: рухаємо по осі X, колізія, потім по осі Y."""
-        sprite.rect.x += dx
-        hit_list = [b for b in blockers if sprite.rect.colliderect(b.rect)]
-        for b in hit_list:
-            if dx > 0: sprite.rect.right = b.rect.left
-            elif dx < 0: sprite.rect.left = b.rect.right
+    def move_and_collide(sprite, dx, dy, tiles):
+        """
+        Swept AABB по сітці тайлів: рухаємо по осі X, потім по осі Y. Перевіряються лише клітинки, які rect проходить.
+        Упершись у тайл, дробова частина по цій осі скидається — позиція стає рівно біля стіни.
+        """
+        sprite.sync_pos()
+        pos, rect = sprite.pos, sprite.rect
+        if dx:
+            x = pos.x + dx
+            Physics._sweep(rect, math.floor(x) - rect.x, 0, tiles)
+            pos.x = x if rect.x == math.floor(x) else rect.x
+        if dy:
+            y = pos.y + dy
+            Physics._sweep(rect, 0, math.floor(y) - rect.y, tiles)
+            pos.y = y if rect.y == math.floor(y) else rect.y
 
-        sprite.rect.y += dy
-        hit_list = [b for b in blockers if sprite.rect.colliderect(b.rect)]
-        for b in hit_list:
-            if dy > 0: sprite.rect.bottom = b.rect.top
-            elif dy < 0: sprite.rect.top = b.rect.bottom
+    @staticmethod
+    def _sweep(rect, dx, dy, tiles):
+        if not dx and not dy:
+            return
+        moved = rect.move(dx, dy)
+        swept = rect.union(moved)
+        for b in tiles.blocks_in_rect(swept):
+            if not b.solid or not swept.colliderect(b.rect):
+                continue
+            r = b.rect
+            # зупиняємось об перший тайл попереду; з тайла, в якому вже стоїмо (спавн, розштовхування),
+            # виштовхуємо назад проти руху — як і до сітки, поки не виїдемо з нього повністю
+            inside = rect.colliderect(r)
+            if inside and not moved.colliderect(r):
+                continue
+            if dx > 0 and (inside or r.left >= rect.right): moved.right = min(moved.right, r.left)
+            elif dx < 0 and (inside or r.right <= rect.left): moved.left = max(moved.left, r.right)
+            elif dy > 0 and (inside or r.top >= rect.bottom): moved.bottom = min(moved.bottom, r.top)
+            elif dy < 0 and (inside or r.bottom <= rect.top): moved.top = max(moved.top, r.bottom)
+        rect.topleft = moved.topleft
 
     @staticmethod
     def rect_collision(a, b) -> bool:
@@ -0,0 +1,66 @@
+"""
+Просторовий хеш (broadphase) на рівномірній сітці з кроком C.TILE: кожен спрайт записаний у клітинки, які перекриває його rect. Оновлюється інкрементально — при русі перезаписуються лише ті спрайти, що змінили набір клітинок.
+"""
+from collections import defaultdict
+from ..core import constants as C
+
+class SpatialHash:
+    def __init__(self, cell=C.TILE):
+        self.cell = cell
+        self._cells = defaultdict(set)   # (cx, cy) -> {sprite}
+        self._span = {}                  # sprite -> (cx0, cy0, cx1, cy1)
+
+    def _span_of(self, rect):
+        c = self.cell
+        return (rect.left // c, rect.top // c,
+                (rect.right - 1) // c, (rect.bottom - 1) // c)
+
+    def __contains__(self, sprite):
+        return sprite in self._span
+
+    def __len__(self):
+        return len(self._span)
+
+    def insert(self, sprite):
+        span = self._span_of(sprite.rect)
+        self._span[sprite] = span
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells[(cx, cy)].add(sprite)
+
+    def remove(self, sprite):
+        span = self._span.pop(sprite, None)
+        if span is None:
+            return
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(sprite)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+
+    def move(self, sprite):
+        """Синхронізує спрайт після зміни rect. Якщо клітинки ті самі — нічого не робить."""
+        old = self._span.get(sprite)
+        if old is not None and old == self._span_of(sprite.rect):
+            return
+        self.remove(sprite)
+        self.insert(sprite)
+
+    def query(self, rect):
+        """Кандидати, що лежать у клітинках, які перекриває rect (без точної перевірки)."""
+        x0, y0, x1, y1 = self._span_of(rect)
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def clear(self):
+        self._cells.clear()
+        self._span.clear()
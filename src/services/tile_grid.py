@@ -0,0 +1,141 @@
+"""
+Сітка зайнятості тайлів рівня: для кожної клітинки cols×rows зберігає Block або None. Будується в LevelSystem.build, оновлюється при руйнуванні цегли.
+Запит по rect перетворюється на діапазон клітинок — вартість O(тайлів під rect), а не O(усіх блоків).
+Слухачі (listeners) отримують (cx, cy), коли клітинка змінюється.
+Для лінії вогню тримаються відсортовані індекси суцільних клітинок по кожному рядку й стовпцю: line_clear — O(log n) через bisect.
+"""
+import math
+from bisect import bisect_right, insort
+import pygame
+from ..core import constants as C
+
+class TileGrid:
+    def __init__(self, cols, rows, origin=(0, 0), tile=C.TILE):
+        self.cols, self.rows = cols, rows
+        self.tile = tile
+        self.rect = pygame.Rect(origin[0], origin[1], cols * tile, rows * tile)
+        self._cells = [None] * (cols * rows)
+        self._solid_in_row = [[] for _ in range(rows)]   # рядок cy -> відсортовані cx суцільних клітинок
+        self._solid_in_col = [[] for _ in range(cols)]   # стовпець cx -> відсортовані cy
+        self.listeners = []
+
+    def cell_of(self, x, y):
+        """Клітинка (cx, cy), у яку потрапляє світова точка (може бути поза сіткою)."""
+        return (x - self.rect.x) // self.tile, (y - self.rect.y) // self.tile
+
+    def in_bounds(self, cx, cy) -> bool:
+        return 0 <= cx < self.cols and 0 <= cy < self.rows
+
+    def get(self, cx, cy):
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self._cells[cy * self.cols + cx]
+        return None
+
+    def is_solid(self, cx, cy) -> bool:
+        b = self.get(cx, cy)
+        return b is not None and b.solid
+
+    def place(self, block):
+        cx, cy = self.cell_of(*block.rect.topleft)
+        self._unindex(cx, cy)
+        self._cells[cy * self.cols + cx] = block
+        if block.solid:
+            insort(self._solid_in_row[cy], cx)
+            insort(self._solid_in_col[cx], cy)
+        self._changed(cx, cy)
+
+    def remove(self, block):
+        cx, cy = self.cell_of(*block.rect.topleft)
+        if self.get(cx, cy) is block:
+            self._unindex(cx, cy)
+            self._cells[cy * self.cols + cx] = None
+            self._changed(cx, cy)
+
+    def _unindex(self, cx, cy):
+        if self.is_solid(cx, cy):
+            self._solid_in_row[cy].remove(cx)
+            self._solid_in_col[cx].remove(cy)
+
+    def _changed(self, cx, cy):
+        for listener in self.listeners:
+            listener(cx, cy)
+
+    def cell_rect(self, cx, cy) -> pygame.Rect:
+        t = self.tile
+        return pygame.Rect(self.rect.x + cx * t, self.rect.y + cy * t, t, t)
+
+    def span(self, rect):
+        """Діапазон клітинок (cx0, cy0, cx1, cy1) під rect, обрізаний межами сітки."""
+        cx0, cy0 = self.cell_of(rect.left, rect.top)
+        cx1, cy1 = self.cell_of(rect.right - 1, rect.bottom - 1)
+        return max(cx0, 0), max(cy0, 0), min(cx1, self.cols - 1), min(cy1, self.rows - 1)
+
+    def blocks_in_rect(self, rect):
+        cx0, cy0, cx1, cy1 = self.span(rect)
+        cells, cols = self._cells, self.cols
+        for cy in range(cy0, cy1 + 1):
+            row = cy * cols
+            for cx in range(cx0, cx1 + 1):
+                b = cells[row + cx]
+                if b is not None:
+                    yield b
+
+    def line_clear(self, a, b) -> bool:
+        """
+        Чи немає суцільних клітинок строго між клітинками a і b, що лежать в одному рядку або стовпці.
+        Для клітинок не на одній лінії — False.
+        """
+        (ax, ay), (bx, by) = a, b
+        if ay == by and 0 <= ay < self.rows:
+            line, lo, hi = self._solid_in_row[ay], min(ax, bx), max(ax, bx)
+        elif ax == bx and 0 <= ax < self.cols:
+            line, lo, hi = self._solid_in_col[ax], min(ay, by), max(ay, by)
+        else:
+            return False
+        i = bisect_right(line, lo)
+        return i == len(line) or line[i] >= hi
+
+    def sweep(self, x0, y0, x1, y1, half):
+        """
+        raycast для квадрата з півстороною half (центр (x0, y0) → (x1, y1)): промені з чотирьох кутів,
+        тож зачіпання краєм теж влучання. Тайл не менший за квадрат, тож між кутовими променями не проскочить.
+        Повертає найближчий по ходу руху суцільний блок або None.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        best, best_d = None, math.inf
+        for ox in (-half, half - 1):
+            for oy in (-half, half - 1):
+                b = self.raycast(x0 + ox, y0 + oy, x1 + ox, y1 + oy)
+                if b is not None:
+                    d = (b.rect.centerx - x0) * dx + (b.rect.centery - y0) * dy
+                    if d < best_d:
+                        best, best_d = b, d
+        return best
+
+    def raycast(self, x0, y0, x1, y1):
+        """
+        Перший суцільний блок на відрізку (x0, y0) → (x1, y1): DDA-обхід клітинок (Amanatides–Woo).
+        Відвідує лише клітинки, які перетинає відрізок, тож не залежить від довжини кроку кулі.
+        """
+        t = self.tile
+        fx0, fy0 = (x0 - self.rect.x) / t, (y0 - self.rect.y) / t
+        fx1, fy1 = (x1 - self.rect.x) / t, (y1 - self.rect.y) / t
+        cx, cy = math.floor(fx0), math.floor(fy0)
+        ex, ey = math.floor(fx1), math.floor(fy1)
+        dx, dy = fx1 - fx0, fy1 - fy0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        delta_x = abs(1 / dx) if dx else math.inf
+        delta_y = abs(1 / dy) if dy else math.inf
+        max_x = ((cx + 1 - fx0) if dx > 0 else (fx0 - cx)) * delta_x if dx else math.inf
+        max_y = ((cy + 1 - fy0) if dy > 0 else (fy0 - cy)) * delta_y if dy else math.inf
+
+        for _ in range(abs(ex - cx) + abs(ey - cy) + 1):
+            b = self.get(cx, cy)
+            if b is not None and b.solid:
+                return b
+            if max_x < max_y:
+                cx += step_x; max_x += delta_x
+            else:
+                cy += step_y; max_y += delta_y
+        return None
@@ -1,9 +1,51 @@
 """
 Спільні UI-компоненти: кнопка, лейбл, панель життя/манти, віджети меню, повідомлення «PAUSE»
+Текст кешується: незмінний підпис — це хіт у словнику (LRU), а числа (HP, рахунок, FPS) складаються з готових гліфів цифр.
+Шрифти сцен беруться з UI.font: один Font на (ім’я, розмір) на весь застосунок, тож атласи цифр не множаться при кожному вході в сцену.
 """
 
+from collections import OrderedDict
 import pygame
 
+class TextCache:
+    """LRU відрендереного тексту за ключем (шрифт, текст, колір, antialias)."""
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._items = OrderedDict()
+
+    def render(self, font, text, color, antialias=True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            return surf
+        surf = font.render(text, antialias, color)
+        self._items[key] = surf
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return surf
+
+class DigitAtlas:
+    """Гліфи «0-9» і «-» одного шрифту й кольору, відрендерені один раз; число малюється їхніми blit'ами."""
+    def __init__(self, font, color, antialias=True):
+        self.glyphs = {ch: font.render(ch, antialias, color) for ch in "0123456789-"}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def width(self, value) -> int:
+        return sum(self.glyphs[ch].get_width() for ch in str(value))
+
+    def draw(self, surf, pos, value) -> pygame.Rect:
+        x, y = pos
+        seq = []
+        for ch in str(value):
+            g = self.glyphs[ch]
+            seq.append((g, (x, y)))
+            x += g.get_width()
+        surf.blits(seq, False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+TEXT_CACHE = TextCache()
+
 class Button:
     def __init__(self, text, rect, on_click):
         self.text = text
@@ -14,7 +56,7 @@ class Button:
     def draw(self, surf):
         pygame.draw.rect(surf, (60, 60, 70), self.rect, border_radius=8)
         pygame.draw.rect(surf, (200, 200, 210), self.rect, 2, border_radius=8)
-        txt = self.font.render(self.text, True, (230, 230, 240))
+        txt = TEXT_CACHE.render(self.font, self.text, (230, 230, 240))
         surf.blit(txt, txt.get_rect(center=self.rect.center))
 
     def handle(self, events):
@@ -26,3 +68,21 @@ class Button:
 class UI:
     def __init__(self, assets):
         self.assets = assets
+        self.text = TEXT_CACHE
+        self._fonts = {}
+        self._digits = {}
+
+    def font(self, name, size) -> pygame.font.Font:
+        key = (name, size)
+        if key not in self._fonts:
+            self._fonts[key] = pygame.font.SysFont(name, size)
+        return self._fonts[key]
+
+    def label(self, font, text, color, antialias=True) -> pygame.Surface:
+        return self.text.render(font, text, color, antialias)
+
+    def digits(self, font, color, antialias=True) -> DigitAtlas:
+        key = (font, tuple(color), antialias)
+        if key not in self._digits:
+            self._digits[key] = DigitAtlas(font, color, antialias)
+        return self._digits[key]
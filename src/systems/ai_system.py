@@ -1,16 +1,30 @@
 """
 Прості вороги: випадкові повороти, уникнення стіни, прицільний вогонь якщо на одній лінії, таймери прийняття рішень.
+Переслідування гравця — по шляху з кешованого A* (services/pathfinding.py).
+Рішення (decide + пошук шляху) приймаються через ThinkScheduler у межах бюджету кадру; далекі й патрульні вороги думають рідше.
+Рух до обраної точки інтегрується щокадру для всіх, у дробових пікселях (Entity.pos).
 """
+import pygame
+from ..core import constants as C
+from ..core.time import ThinkScheduler
+
 class AISystem:
-    def __init__(self, physics):
+    def __init__(self, physics, paths=None, budget_us=500):
         self.physics = physics
+        self.paths = paths
+        self.scheduler = ThinkScheduler(budget_us)
+        self.near = C.TILE * 8          # ближче — думаємо часто
+        self.near_period = 0.1
+        self.far_period = 0.4
 
-    def update(self, dt, enemies, blocks, bounds):
+    def update(self, dt, enemies, tiles, bounds, target=None):
+        self.scheduler.run(enemies, dt,
+                           lambda e, elapsed: self._think(e, elapsed, tiles, target),
+                           lambda e: self._period(e, target))
         for e in enemies:
-            e.decide(dt)
-            dx = int(e.dir.x * e.speed * dt)
-            dy = int(e.dir.y * e.speed * dt)
-            self.physics.move_and_collide(e, dx, dy, blocks)
+            e.sync_pos()
+            dx, dy = self._step(e, dt)
+            self.physics.move_and_collide(e, dx, dy, tiles)
 
             # не виходити за межі карти
             if not bounds.contains(e.rect):
@@ -18,3 +32,35 @@ class AISystem:
                 if e.rect.right > bounds.right: e.rect.right = bounds.right
                 if e.rect.top < bounds.top: e.rect.top = bounds.top
                 if e.rect.bottom > bounds.bottom: e.rect.bottom = bounds.bottom
+
+    def _period(self, e, target):
+        if target is None:
+            return self.far_period
+        if e.state == "pursue":
+            return self.near_period
+        d = abs(e.rect.centerx - target.rect.centerx) + abs(e.rect.centery - target.rect.centery)
+        return self.near_period if d <= self.near else self.far_period
+
+    def _think(self, e, elapsed, tiles, target):
+        e.decide(elapsed)
+        e.waypoint = None
+        if e.state != "pursue" or target is None or not self.paths:
+            return
+        start = tiles.cell_of(*e.rect.center)
+        path = self.paths.find(start, tiles.cell_of(*target.rect.center))
+        if path and len(path) > 1:
+            e.waypoint = tiles.cell_rect(*path[1]).topleft
+
+    def _step(self, e, dt):
+        """Зсув за кадр. З точкою шляху: спершу вирівнюємось по меншій осі (щоб влізти в прохід шириною 1 тайл), потім їдемо по більшій, без перельоту."""
+        if e.waypoint is not None:
+            ox, oy = e.waypoint[0] - e.pos.x, e.waypoint[1] - e.pos.y
+            if ox and oy:
+                if abs(ox) < abs(oy): oy = 0
+                else: ox = 0
+            if ox or oy:
+                e.dir = pygame.Vector2((ox > 0) - (ox < 0), (oy > 0) - (oy < 0))
+                step = e.speed * dt
+                return max(-step, min(step, ox)), max(-step, min(step, oy))
+            e.waypoint = None
+        return e.dir.x * e.speed * dt, e.dir.y * e.speed * dt
@@ -1,41 +1,66 @@
 """
 Єдине місце перевірки зіткнень між групами: кулі ↔ блоки, кулі ↔ танки, танки ↔ тайли, танки ↔ бонуси. Видає події «HIT_BRICK», «HIT_STEEL», «TANK_DAMAGED», «POWERUP_PICKED».
+Broadphase — DDA-промінь по сітці тайлів для блоків і просторовий хеш по клітинках C.TILE для танків/бази: куля перевіряється лише з об’єктами зі своїх клітинок, за кадр обробляються всі влучання.
 """
 
 from ..core import constants as C
+from ..services.spatial_hash import SpatialHash
 
 class CollisionSystem:
-    def __init__(self, physics):
+    def __init__(self, physics, tiles):
         self.physics = physics
+        self.tiles = tiles
+        self.grid = SpatialHash(C.TILE)
+
+    def track(self, *sprites):
+        """Реєструє танки й базу в хеші. Блоки живуть у сітці тайлів."""
+        for s in sprites:
+            if s is not None:
+                self.grid.insert(s)
+
+    def _drop(self, sprite, group):
+        group.remove(sprite); sprite.kill()
+        self.grid.remove(sprite)
 
     def update(self, player, enemies, bullets, blocks, eagle, on_events):
+        # інкрементальна синхронізація тих, хто рухався
+        self.grid.move(player)
+        for e in enemies: self.grid.move(e)
+        for b in bullets: self.grid.move(b)
+
         for b in list(bullets):
-            # блоки
-            for bl in list(blocks):
-                if self.physics.rect_collision(b, bl):
-                    bullets.remove(b); b.kill()
-                    if bl.kind == "brick":
-                        bl.hp -= 1
-                        if bl.hp <= 0:
-                            blocks.remove(bl); bl.kill()
-                    return
+            hits = [s for s in self.grid.query(b.rect)
+                    if s is not b and self.physics.rect_collision(b, s)]
+
+            # блоки — перший суцільний тайл на шляху кулі за кадр
+            bl = self.tiles.sweep(*b.prev_center, *b.rect.center, b.rect.width // 2)
+            if bl is not None:
+                self._drop(b, bullets)
+                if bl.kind == "brick":
+                    bl.hp -= 1
+                    if bl.hp <= 0:
+                        blocks.remove(bl); bl.kill()
+                        self.tiles.remove(bl)
+                continue
             # вороги
             if b.owner_tag == "player":
-                for e in list(enemies):
-                    if self.physics.rect_collision(b, e):
-                        enemies.remove(e); e.kill()
-                        bullets.remove(b); b.kill()
-                        return
-            else:
+                e = next((s for s in hits if s.tag == "enemy"), None)
+                if e is not None:
+                    self._drop(e, enemies)
+                    self._drop(b, bullets)
+                    continue
+            elif player in hits:
                 # ворожа куля потрапила в гравця
-                if self.physics.rect_collision(b, player):
-                    bullets.remove(b); b.kill()
-                    player.take_damage(1)
-                    if not player.alive:
-                        on_events("player_dead")
-                    return
+                self._drop(b, bullets)
+                player.take_damage(1)
+                if not player.alive:
+                    on_events("player_dead")
+                continue
             # база
-            if eagle and self.physics.rect_collision(b, eagle):
-                bullets.remove(b); b.kill()
+            if eagle and eagle in hits:
+                self._drop(b, bullets)
                 on_events("eagle_down")
-                return
+                continue
+            # вилетіла за межі карти
+            if not self.tiles.rect.collidepoint(b.rect.center):
+                self._drop(b, bullets)
@@ -1,5 +1,7 @@
 """
 Завантаження/побудова рівня з data/levels/*.txt: парсинг символів у тайли/спавн-поінти, ресет сцени при програші/перемозі, перехід на наступний рівень.
+Тайли запікаються в одну поверхню (layer) при побудові; коли блок зникає з TileGrid, перемальовується лише його клітинка.
+Карта, що вміщується у вікно, центрується в ньому; більша починається з (0, 0) і прокручується камерою (core/camera.py).
 """
 import pygame
 from ..core import constants as C
@@ -7,6 +9,7 @@ from ..entities.block import Block
 from ..entities.eagle_base import EagleBase
 from ..entities.enemy import Enemy
 from ..entities.tank import Tank
+from ..services.tile_grid import TileGrid
 
 LEVEL_MAP = [
     "##########################",
@@ -32,19 +35,22 @@ SYMBOLS = {
 class LevelSystem:
     def __init__(self, assets):
         self.assets = assets
+        self.tiles = None
+        self.layer = None
 
-    def build(self):
+    def build(self, level_map=LEVEL_MAP):
         blocks = pygame.sprite.Group()
         enemies = pygame.sprite.Group()
         player = None
         eagle = None
 
-        map_width = len(LEVEL_MAP[0]) * C.TILE
-        map_height = len(LEVEL_MAP) * C.TILE
-        offset_x = (C.WIDTH - map_width) // 2
-        offset_y = (C.HEIGHT - map_height) // 2
+        map_width = len(level_map[0]) * C.TILE
+        map_height = len(level_map) * C.TILE
+        offset_x = max((C.WIDTH - map_width) // 2, 0)
+        offset_y = max((C.HEIGHT - map_height) // 2, 0)
+        self.tiles = TileGrid(len(level_map[0]), len(level_map), (offset_x, offset_y))
 
-        for y, row in enumerate(LEVEL_MAP):
+        for y, row in enumerate(level_map):
             for x, ch in enumerate(row):
                 info = SYMBOLS.get(ch)
                 if not info:
@@ -53,17 +59,47 @@ class LevelSystem:
                 px, py = offset_x + x * C.TILE, offset_y + y * C.TILE
                 if kind == "brick":
                     img = self.assets.image("brick", size=(C.TILE, C.TILE))
-                    blocks.add(Block(img, (px, py), kind="brick", hp=hp, solid=solid))
+                    block = Block(img, (px, py), kind="brick", hp=hp, solid=solid)
+                    blocks.add(block)
+                    self.tiles.place(block)
                 elif kind == "eagle":
                     img = self.assets.image("eagle", size=(C.TILE, C.TILE))
                     eagle = EagleBase(img, (px, py))
                 elif kind == "enemy":
-                    img = self.assets.image("enemy", size=(C.TILE, C.TILE))
-                    enemies.add(Enemy(img, (px, py)))
+                    enemies.add(Enemy(self.assets.directional("enemy", size=(C.TILE, C.TILE)), (px, py)))
                 elif kind == "player":
-                    img = self.assets.image("player", size=(C.TILE, C.TILE))
-                    player = Tank(img, (px, py))
+                    player = Tank(self.assets.directional("player", size=(C.TILE, C.TILE)), (px, py))
+
+        self._bake_layer()
 
         # межі карти
         bounds = pygame.Rect(offset_x, offset_y, map_width, map_height)
         return player, enemies, blocks, eagle, bounds
+
+    def _bake_layer(self):
+        self.layer = pygame.Surface(self.tiles.rect.size, pygame.SRCALPHA)
+        for cy in range(self.tiles.rows):
+            for cx in range(self.tiles.cols):
+                self._repaint_cell(cx, cy)
+        self.tiles.listeners.append(self._repaint_cell)
+
+    def _repaint_cell(self, cx, cy):
+        """Перемальовує одну клітинку запеченого шару тайлів."""
+        t = self.tiles.tile
+        rect = pygame.Rect(cx * t, cy * t, t, t)
+        self.layer.fill((0, 0, 0, 0), rect)
+        block = self.tiles.get(cx, cy)
+        if block is not None:
+            self.layer.blit(block.image, rect)
+
+    def draw(self, screen, area=None, camera=None):
+        """Шар тайлів на screen; area — лише ця світова ділянка; camera — лише видиме, у екранних координатах."""
+        if not self.layer:
+            return
+        if camera is not None:
+            area = camera.view.clip(area or self.tiles.rect)
+            screen.blit(self.layer, camera.apply(area), area.move(-self.tiles.rect.x, -self.tiles.rect.y))
+        elif area is None:
+            screen.blit(self.layer, self.tiles.rect)
+        else:
+            screen.blit(self.layer, area, area.move(-self.tiles.rect.x, -self.tiles.rect.y))
@@ -1,26 +1,52 @@
 """
 Правила стрільби: контроль перезарядки, створення кулі, звуки/ефекти при пострілі, обмеження «1 куля на екрані» для базового танка.
+Вороги стріляють прицільно: лише коли ціль на одній лінії з ними і лінія вогню вільна (TileGrid.line_clear).
 """
 
 import pygame
+from ..core.pool import Pool
 from ..entities.bullet import Bullet
 
 class ShootingSystem:
     def __init__(self, assets):
         self.assets = assets
+        self.pool = Pool(Bullet)    # кулі повертаються сюди через kill()
+        self.sprites = self.assets.directional("bullet", size=(8, 8))
+        self.pool.prewarm(16, self.sprites, (0, 0), (0, -1))
 
+    # bullets_group — група або кортеж груп (кулі, рендер-група сцени)
     def player_try_shoot(self, player, bullets_group):
         if player.can_shoot():
-            img = self.assets.image("bullet", size=(8, 8))
             pos = player.rect.center
-            b = Bullet(img, (pos[0]-4, pos[1]-4), player.direction, owner_tag="player")
-            bullets_group.add(b)
+            b = self.pool.acquire(self.sprites, (pos[0]-4, pos[1]-4), player.direction, owner_tag="player")
+            b.add(bullets_group)
             player.shot_fired()
 
-    def enemy_try_shoot(self, enemy, bullets_group):
+    def enemy_try_shoot(self, enemy, bullets_group, tiles=None, targets=()):
         if enemy.can_shoot():
-            img = self.assets.image("bullet", size=(8, 8))
+            if tiles is not None:
+                aim = self._target_in_line(enemy, tiles, targets)
+                if aim is None:
+                    return
+                # розвертаємось до цілі — уздовж спільного рядка/стовпця
+                enemy.dir = aim[1]
             pos = enemy.rect.center
-            b = Bullet(img, (pos[0]-4, pos[1]-4), enemy.dir, owner_tag="enemy")
-            bullets_group.add(b)
+            b = self.pool.acquire(self.sprites, (pos[0]-4, pos[1]-4), enemy.dir, owner_tag="enemy")
+            b.add(bullets_group)
             enemy.shot_fired()
+
+    def _target_in_line(self, enemy, tiles, targets):
+        """
+        Перша ціль в одному рядку/стовпці тайлів з ворогом, до якої куля долетить: (ціль, напрям) або None.
+        Напрям береться з клітинок, а не з пікселів центрів — завжди вздовж однієї осі.
+        """
+        cell = tiles.cell_of(*enemy.rect.center)
+        for t in targets:
+            if t is None or not t.alive:
+                continue
+            tc = tiles.cell_of(*t.rect.center)
+            if tc != cell and tiles.line_clear(cell, tc):
+                if tc[1] == cell[1]:
+                    return t, pygame.Vector2((tc[0] > cell[0]) - (tc[0] < cell[0]), 0)
+                return t, pygame.Vector2(0, (tc[1] > cell[1]) - (tc[1] < cell[1]))
+        return None
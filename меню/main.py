@@ -12,6 +12,8 @@ import json
 import math
 import time
 import random
+from collections import OrderedDict
+import numpy as np
 import pygame
 from pygame import mixer
 
@@ -23,6 +25,7 @@ DEFAULT_SETTINGS = {
     "width": 1280,
     "height": 720,
     "fullscreen": False,
+    "render_scale": False,
     "music_volume": 0.5,
     "sfx_volume": 0.7,
     "controls": {
@@ -40,6 +43,11 @@ RESOLUTIONS = [
     (1024, 576), (1600, 1200), (2560, 1440)
 ]
 
+# Render-scale mode: scenes draw into a fixed logical canvas and a single scale pass
+# copies it into the window (letterboxed), so frame cost does not grow with resolution.
+# Nearest-neighbour scale: smoothscale is ~2.5x slower at 2560x1440 and would eat the savings.
+LOGICAL_SIZE = (832, 768)  # same as WIDTH, HEIGHT in src/core/constants.py
+
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 if not os.path.isdir(ASSETS_DIR):
     os.makedirs(ASSETS_DIR, exist_ok=True)
@@ -79,10 +87,46 @@ pygame.display.set_caption(APP_TITLE)
 
 settings = load_settings()
 
-flags = pygame.DOUBLEBUF
-if settings.get("fullscreen"):
-    flags |= pygame.FULLSCREEN
-SCREEN = pygame.display.set_mode((settings["width"], settings["height"]), flags)
+
+def set_display_mode():
+    """(Re)create the window. With render_scale on, SCREEN is the logical canvas, not the window."""
+    global DISPLAY, SCREEN, VIEWPORT, _TARGET
+    flags = pygame.DOUBLEBUF
+    if settings.get("fullscreen"):
+        flags |= pygame.FULLSCREEN
+    DISPLAY = pygame.display.set_mode((settings["width"], settings["height"]), flags)
+    if settings.get("render_scale"):
+        (dw, dh), (lw, lh) = DISPLAY.get_size(), LOGICAL_SIZE
+        k = min(dw / lw, dh / lh)
+        VIEWPORT = pygame.Rect(0, 0, int(lw * k), int(lh * k))
+        VIEWPORT.center = (dw // 2, dh // 2)
+        SCREEN = pygame.Surface(LOGICAL_SIZE).convert()
+        _TARGET = DISPLAY.subsurface(VIEWPORT)
+        DISPLAY.fill((0, 0, 0))  # letterbox bars
+    else:
+        VIEWPORT = DISPLAY.get_rect()
+        SCREEN = DISPLAY
+        _TARGET = None
+
+
+def present():
+    if _TARGET is not None:
+        pygame.transform.scale(SCREEN, VIEWPORT.size, _TARGET)
+    pygame.display.flip()
+
+
+def to_logical(e):
+    """Mouse events carry window coordinates; map them onto the logical canvas."""
+    if _TARGET is None or e.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return e
+    sx, sy = SCREEN.get_width() / VIEWPORT.w, SCREEN.get_height() / VIEWPORT.h
+    data = dict(e.dict, pos=(int((e.pos[0] - VIEWPORT.x) * sx), int((e.pos[1] - VIEWPORT.y) * sy)))
+    if e.type == pygame.MOUSEMOTION:
+        data["rel"] = (int(e.rel[0] * sx), int(e.rel[1] * sy))
+    return pygame.event.Event(e.type, data)
+
+
+set_display_mode()
 CLOCK = pygame.time.Clock()
 
 # Fonts
@@ -95,6 +139,60 @@ except Exception:
     SMALL_FONT = pygame.font.SysFont(None, 18)
     BIG_FONT = pygame.font.SysFont(None, 64)
 
+_FONTS = {}
+
+
+def font_of_size(size):
+    """Fonts are loaded once per size instead of on every draw."""
+    if size not in _FONTS:
+        try:
+            _FONTS[size] = pygame.font.Font(pygame.font.match_font("verdana,arial,dejavusans"), size)
+        except Exception:
+            _FONTS[size] = pygame.font.SysFont(None, size)
+    return _FONTS[size]
+
+
+# Rendered-text cache: an unchanged caption costs a dict hit instead of font.render
+TEXT_CACHE_SIZE = 256
+_TEXT_CACHE = OrderedDict()
+
+
+def render_text(font, text, color, antialias=True):
+    key = (font, text, color, antialias)
+    surf = _TEXT_CACHE.get(key)
+    if surf is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return surf
+    surf = font.render(text, antialias, color)
+    _TEXT_CACHE[key] = surf
+    if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+    return surf
+
+
+class DigitAtlas:
+    # Digit glyphs rendered once; changing numbers (FPS, percentages) are composed from them
+    def __init__(self, font, color, antialias=True):
+        self.glyphs = {ch: font.render(ch, antialias, color) for ch in "0123456789-"}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def width(self, value):
+        return sum(self.glyphs[ch].get_width() for ch in str(value))
+
+    def draw(self, surf, pos, value):
+        x, y = pos
+        seq = []
+        for ch in str(value):
+            g = self.glyphs[ch]
+            seq.append((g, (x, y)))
+            x += g.get_width()
+        surf.blits(seq, False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+
+FPS_DIGITS = DigitAtlas(SMALL_FONT, (180, 180, 190))
+SLIDER_DIGITS = DigitAtlas(UI_FONT, (230, 230, 230))
+
 # Sounds (generate placeholders if files are missing)
 CLICK_SOUND = None
 HOVER_SOUND = None
@@ -193,7 +291,7 @@ class Button:
         c2 = (0, 0, 0)
         pygame.draw.rect(surf, c1, self.rect, border_radius=14)
         pygame.draw.rect(surf, c2, self.rect, width=3, border_radius=14)
-        label = UI_FONT.render(self.text, True, (240, 240, 240))
+        label = render_text(UI_FONT, self.text, (240, 240, 240))
         surf.blit(label, label.get_rect(center=self.rect.center))
 
     @staticmethod
@@ -224,7 +322,7 @@ class Toggle:
 
     def draw(self, surf):
         x, y = self.pos
-        label = UI_FONT.render(self.text, True, (230, 230, 230))
+        label = render_text(UI_FONT, self.text, (230, 230, 230))
         surf.blit(label, (x, y - 6))
         knob_x = self.rect.x + (22 if self.value else 0)
         bg = (80, 200, 120) if self.value else (120, 120, 120)
@@ -256,8 +354,10 @@ class Slider:
 
     def draw(self, surf):
         x, y = self.pos
-        label = UI_FONT.render(f"{self.text}: {int(self.value*100)}%", True, (230, 230, 230))
+        label = render_text(UI_FONT, f"{self.text}: ", (230, 230, 230))
         surf.blit(label, (x, y))
+        num = SLIDER_DIGITS.draw(surf, (x + label.get_width(), y), int(self.value * 100))
+        surf.blit(render_text(UI_FONT, "%", (230, 230, 230)), num.topright)
         pygame.draw.rect(surf, (70, 70, 70), self.rect, border_radius=3)
         knob_x = int(self.rect.x + self.value * self.width)
         pygame.draw.circle(surf, (200, 200, 200), (knob_x, self.rect.centery), 9)
@@ -292,11 +392,11 @@ class Dropdown:
                     self.open = False
 
     def draw(self, surf):
-        label = UI_FONT.render(self.text, True, (230, 230, 230))
+        label = render_text(UI_FONT, self.text, (230, 230, 230))
         surf.blit(label, (self.rect.x, self.rect.y - 36))
         pygame.draw.rect(surf, (30, 30, 30), self.rect, border_radius=8)
         pygame.draw.rect(surf, (0, 0, 0), self.rect, width=2, border_radius=8)
-        txt = UI_FONT.render(str(self.options[self.index]), True, (240, 240, 240))
+        txt = render_text(UI_FONT, str(self.options[self.index]), (240, 240, 240))
         surf.blit(txt, txt.get_rect(center=self.rect.center))
         # Arrow
         pygame.draw.polygon(surf, (200, 200, 200), [
@@ -309,7 +409,7 @@ class Dropdown:
                 orect = pygame.Rect(self.rect.x, self.rect.y + (i + 1) * self.rect.h, self.rect.w, self.rect.h)
                 pygame.draw.rect(surf, (45, 45, 45), orect)
                 pygame.draw.rect(surf, (0, 0, 0), orect, width=1)
-                t = UI_FONT.render(str(opt), True, (220, 220, 220))
+                t = render_text(UI_FONT, str(opt), (220, 220, 220))
                 surf.blit(t, t.get_rect(center=orect.center))
 
 
@@ -372,34 +472,64 @@ class SceneManager:
 
 # -------------------------- BACKGROUND FX --------------------------
 class GridBG:
-    def __init__(self, w, h):
+    SPACING = 40
+    STAR_COLOR = (180, 220, 255)
+    # baked layers are shared by every scene with the same screen size
+    _grids = {}
+    _star_sprites = {}
+
+    def __init__(self, w, h, count=120):
         self.w, self.h = w, h
         self.t = 0
-        self.stars = [(random.randint(0, w), random.randint(0, h), random.random()*1.0+0.2) for _ in range(120)]
+        self.x = np.random.uniform(0, w, count).astype(np.float32)
+        self.y = np.random.randint(0, h + 1, count).astype(np.float32)
+        self.s = np.random.uniform(0.2, 1.2, count).astype(np.float32)
+        self.radius = np.maximum(1, (2 * self.s).astype(np.int32))
+        self.grid = self._grid(w, h)
+        self.sprites = {int(r): self._star(int(r)) for r in np.unique(self.radius)}
+
+    @classmethod
+    def _grid(cls, w, h):
+        # one spacing wider/taller than the screen, so any offset is a single blit
+        key = (w, h)
+        if key not in cls._grids:
+            sp = cls.SPACING
+            grid = pygame.Surface((w + sp, h + sp))
+            grid.fill((14, 16, 22))
+            for x in range(0, w + sp, sp):
+                pygame.draw.line(grid, (22, 30, 48), (x, 0), (x, h + sp), 1)
+            for y in range(0, h + sp, sp):
+                pygame.draw.line(grid, (22, 30, 48), (0, y), (w + sp, y), 1)
+            cls._grids[key] = grid.convert()
+        return cls._grids[key]
+
+    @classmethod
+    def _star(cls, r):
+        if r not in cls._star_sprites:
+            spr = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+            pygame.draw.circle(spr, cls.STAR_COLOR, (r, r), r)
+            cls._star_sprites[r] = spr
+        return cls._star_sprites[r]
 
     def update(self, dt):
         self.t += dt * 0.6
-        # parallax drift
-        for i in range(len(self.stars)):
-            x, y, s = self.stars[i]
-            x -= s * 30 * dt
-            if x < 0:
-                x = self.w
-                y = random.randint(0, self.h)
-            self.stars[i] = (x, y, s)
+        # parallax drift, wrapped stars re-enter at the right edge at a random height
+        self.x -= self.s * (30 * dt)
+        wrapped = self.x < 0
+        n = int(np.count_nonzero(wrapped))
+        if n:
+            self.x[wrapped] = self.w
+            self.y[wrapped] = np.random.randint(0, self.h + 1, n)
 
     def draw(self, surf):
-        surf.fill((14, 16, 22))
         # moving grid lines
-        spacing = 40
-        offset = int((math.sin(self.t)*0.5+0.5) * spacing)
-        for x in range(-offset, self.w, spacing):
-            pygame.draw.line(surf, (22, 30, 48), (x, 0), (x, self.h), 1)
-        for y in range(offset, self.h, spacing):
-            pygame.draw.line(surf, (22, 30, 48), (0, y), (self.w, y), 1)
+        sp = self.SPACING
+        offset = int((math.sin(self.t)*0.5+0.5) * sp)
+        surf.blit(self.grid, (-offset, offset - sp))
         # stars
-        for x, y, s in self.stars:
-            pygame.draw.circle(surf, (180, 220, 255), (int(x), int(y)), max(1, int(2*s)))
+        sprites = self.sprites
+        surf.blits([(sprites[r], (x - r, y - r)) for x, y, r in
+                    zip(self.x.astype(np.int32).tolist(), self.y.astype(np.int32).tolist(), self.radius.tolist())], False)
 
 
 # -------------------------- SCENES --------------------------
@@ -439,14 +569,14 @@ class MainMenu(Scene):
 
     def draw(self, surf):
         self.bg.draw(surf)
-        title = BIG_FONT.render("TANK BATTLES", True, (240, 240, 255))
+        title = render_text(BIG_FONT, "TANK BATTLES", (240, 240, 255))
         tw, th = title.get_size()
         wobble = int(math.sin(self.logo_phase * 1.8) * 6)
         surf.blit(title, (surf.get_width() // 2 - tw // 2, 90 + wobble))
         for b in self.buttons:
             b.draw(surf)
         # hint
-        tip = SMALL_FONT.render("Homework demo: Menu + scenes (Pygame)", True, (200, 200, 220))
+        tip = render_text(SMALL_FONT, "Homework demo: Menu + scenes (Pygame)", (200, 200, 220))
         surf.blit(tip, (10, surf.get_height() - 26))
 
 
@@ -463,11 +593,13 @@ class Settings(Scene):
                 break
         self.drop_res = Dropdown("Resolution", RESOLUTIONS, res_idx, (w//2 - 150, 200, 300, 44), self.on_res_change)
         self.tgl_full = Toggle("Fullscreen", settings.get("fullscreen", False), (w//2 - 150, 280), self.on_full_change)
+        self.tgl_scale = Toggle("Render scale", settings.get("render_scale", False), (w//2 + 30, 280), self.on_scale_change)
         self.sld_music = Slider("Music", settings.get("music_volume", 0.5), (w//2 - 150, 350), on_change=self.on_music_change)
         self.sld_sfx = Slider("SFX", settings.get("sfx_volume", 0.7), (w//2 - 150, 420), on_change=self.on_sfx_change)
         self.btn_apply = Button("APPLY", (w//2 - 150, 500, 140, 48), self.apply_changes)
         self.btn_back = Button("BACK", (w//2 + 10, 500, 140, 48), lambda: mgr.change("main"))
-        self.pending = {"resolution": (settings["width"], settings["height"]), "fullscreen": settings.get("fullscreen", False)}
+        self.pending = {"resolution": (settings["width"], settings["height"]), "fullscreen": settings.get("fullscreen", False),
+                        "render_scale": settings.get("render_scale", False)}
 
     def on_res_change(self, value):
         self.pending["resolution"] = value
@@ -475,6 +607,9 @@ class Settings(Scene):
     def on_full_change(self, value):
         self.pending["fullscreen"] = value
 
+    def on_scale_change(self, value):
+        self.pending["render_scale"] = value
+
     def on_music_change(self, value):
         settings["music_volume"] = float(value)
         try:
@@ -492,18 +627,19 @@ class Settings(Scene):
         w, h = self.pending["resolution"]
         settings["width"], settings["height"] = int(w), int(h)
         settings["fullscreen"] = bool(self.pending["fullscreen"])
+        settings["render_scale"] = bool(self.pending["render_scale"])
         save_settings(settings)
-        global SCREEN
-        flags = pygame.DOUBLEBUF
-        if settings["fullscreen"]:
-            flags |= pygame.FULLSCREEN
-        SCREEN = pygame.display.set_mode((settings["width"], settings["height"]), flags)
-        self.bg = GridBG(*SCREEN.get_size())
+        old_size = SCREEN.get_size()
+        set_display_mode()
+        if SCREEN.get_size() != old_size:
+            # layouts are computed in scene constructors: rebuild them for the new canvas
+            build_scenes("settings")
         CLICK_SOUND.play()
 
     def handle_event(self, e):
         self.drop_res.handle_event(e)
         self.tgl_full.handle_event(e)
+        self.tgl_scale.handle_event(e)
         self.sld_music.handle_event(e)
         self.sld_sfx.handle_event(e)
         self.btn_apply.handle_event(e)
@@ -516,10 +652,11 @@ class Settings(Scene):
 
     def draw(self, surf):
         self.bg.draw(surf)
-        title = BIG_FONT.render("SETTINGS", True, (240, 240, 255))
+        title = render_text(BIG_FONT, "SETTINGS", (240, 240, 255))
         surf.blit(title, (surf.get_width()//2 - title.get_width()//2, 90))
         self.drop_res.draw(surf)
         self.tgl_full.draw(surf)
+        self.tgl_scale.draw(surf)
         self.sld_music.draw(surf)
         self.sld_sfx.draw(surf)
         self.btn_apply.draw(surf)
@@ -570,7 +707,7 @@ class Controls(Scene):
 
     def draw(self, surf):
         self.bg.draw(surf)
-        title = BIG_FONT.render("CONTROLS", True, (240, 240, 255))
+        title = render_text(BIG_FONT, "CONTROLS", (240, 240, 255))
         surf.blit(title, (surf.get_width()//2 - title.get_width()//2, 90))
         w, h = surf.get_size()
         left = w//2 - 260
@@ -579,12 +716,12 @@ class Controls(Scene):
             r = pygame.Rect(left, top + i*54, 520, 44)
             pygame.draw.rect(surf, (28, 28, 36), r, border_radius=10)
             pygame.draw.rect(surf, (0, 0, 0), r, width=2, border_radius=10)
-            text = UI_FONT.render(label, True, (230, 230, 230))
+            text = render_text(UI_FONT, label, (230, 230, 230))
             val = pygame.key.name(settings["controls"][key])
-            val_text = UI_FONT.render(("<press a key>" if self.waiting_key == key else val), True, (180, 240, 200))
+            val_text = render_text(UI_FONT, ("<press a key>" if self.waiting_key == key else val), (180, 240, 200))
             surf.blit(text, (r.x + 12, r.y + 10))
             surf.blit(val_text, val_text.get_rect(right=r.right - 12, centery=r.centery))
-        tip = SMALL_FONT.render("Click a row to rebind. Press any key to set.", True, (200, 200, 220))
+        tip = render_text(SMALL_FONT, "Click a row to rebind. Press any key to set.", (200, 200, 220))
         surf.blit(tip, (w//2 - tip.get_width()//2, top + len(self.actions)*54 + 12))
         self.btn_back.draw(surf)
 
@@ -614,11 +751,11 @@ class Help(Scene):
 
     def draw(self, surf):
         self.bg.draw(surf)
-        title = BIG_FONT.render("HELP", True, (240, 240, 255))
+        title = render_text(BIG_FONT, "HELP", (240, 240, 255))
         surf.blit(title, (surf.get_width()//2 - title.get_width()//2, 90))
         y = 210
         for line in self.HELP_TEXT:
-            txt = UI_FONT.render(line, True, (230, 230, 230))
+            txt = render_text(UI_FONT, line, (230, 230, 230))
             surf.blit(txt, (surf.get_width()//2 - txt.get_width()//2, y))
             y += 38
         self.btn_back.draw(surf)
@@ -685,8 +822,7 @@ class Credits(Scene):
         y = int(self.scroll)
         for i, line in enumerate(self.LINES):
             size = 44 if i == 0 else 24
-            f = pygame.font.Font(pygame.font.match_font("verdana,arial,dejavusans"), size)
-            txt = f.render(line, True, (230, 230, 230))
+            txt = render_text(font_of_size(size), line, (230, 230, 230))
             surf.blit(txt, (surf.get_width()//2 - txt.get_width()//2, y))
             y += 50
         self.btn_back.draw(surf)
@@ -703,7 +839,7 @@ class Game(Scene):
         self.bullets = []
         self.cooldown = 0
         self.paused = False
-        self.pause_text = UI_FONT.render("PAUSED — press Esc to resume", True, (240, 240, 240))
+        self.pause_text = render_text(UI_FONT, "PAUSED — press Esc to resume", (240, 240, 240))
 
     def handle_event(self, e):
         if e.type == pygame.KEYUP:
@@ -755,7 +891,7 @@ class Game(Scene):
         pygame.draw.rect(surf, (40, 120, 80), (self.tank.centerx - 3, self.tank.y - 12, 6, 12))
         for b in self.bullets:
             pygame.draw.circle(surf, (230, 230, 90), (int(b[0]), int(b[1])), 4)
-        hud = SMALL_FONT.render("Esc: pause | Backspace: return to menu", True, (220, 220, 230))
+        hud = render_text(SMALL_FONT, "Esc: pause | Backspace: return to menu", (220, 220, 230))
         surf.blit(hud, (10, 10))
         if self.paused:
             surf.blit(self.pause_text, self.pause_text.get_rect(center=(surf.get_width()//2, surf.get_height()//2)))
@@ -767,21 +903,21 @@ class Game(Scene):
 
 
 # -------------------------- APP SETUP --------------------------
+SCENES = {"main": MainMenu, "settings": Settings, "controls": Controls,
+          "help": Help, "credits": Credits, "game": Game}
+
+
+def build_scenes(current="main"):
+    """(Re)create every scene for the current SCREEN size and make `current` active."""
+    global scene_game
+    for key, cls in SCENES.items():
+        manager.register(key, cls(manager))
+    scene_game = manager.scenes["game"]
+    manager.current = manager.scenes[current]
+
+
 manager = SceneManager()
-scene_main = MainMenu(manager)
-scene_settings = Settings(manager)
-scene_controls = Controls(manager)
-scene_help = Help(manager)
-scene_credits = Credits(manager)
-scene_game = Game(manager)
-
-manager.register("main", scene_main)
-manager.register("settings", scene_settings)
-manager.register("controls", scene_controls)
-manager.register("help", scene_help)
-manager.register("credits", scene_credits)
-manager.register("game", scene_game)
-manager.current = scene_main
+build_scenes()
 
 
 # -------------------------- MAIN LOOP --------------------------
@@ -792,13 +928,13 @@ while running:
     accum += dt
 
     for event in pygame.event.get():
+        event = to_logical(event)
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYUP:
             if event.key == pygame.K_F11:
                 settings["fullscreen"] = not settings.get("fullscreen", False)
-                flags = pygame.DOUBLEBUF | (pygame.FULLSCREEN if settings["fullscreen"] else 0)
-                SCREEN = pygame.display.set_mode((settings["width"], settings["height"]), flags)
+                set_display_mode()
                 save_settings(settings)
             elif event.key == pygame.K_ESCAPE:
                 manager.change("main")  # ← тепер Esc повертає в головне меню!
@@ -814,11 +950,13 @@ while running:
     manager.draw(SCREEN)
 
     # FPS лічильник
-    fps_str = f"{CLOCK.get_fps():.0f} FPS"
-    fps_img = SMALL_FONT.render(fps_str, True, (180, 180, 190))
-    SCREEN.blit(fps_img, (SCREEN.get_width() - fps_img.get_width() - 10, 8))
+    fps = int(CLOCK.get_fps() + 0.5)
+    fps_label = render_text(SMALL_FONT, " FPS", (180, 180, 190))
+    fps_x = SCREEN.get_width() - fps_label.get_width() - 10
+    SCREEN.blit(fps_label, (fps_x, 8))
+    FPS_DIGITS.draw(SCREEN, (fps_x - FPS_DIGITS.width(fps), 8), fps)
 
-    pygame.display.flip()
+    present()
 
 
 
@@ -827,11 +965,13 @@ while running:
     manager.draw(SCREEN)
 
     # FPS counter (small)
-    fps_str = f"{CLOCK.get_fps():.0f} FPS"
-    fps_img = SMALL_FONT.render(fps_str, True, (180, 180, 190))
-    SCREEN.blit(fps_img, (SCREEN.get_width() - fps_img.get_width() - 10, 8))
+    fps = int(CLOCK.get_fps() + 0.5)
+    fps_label = render_text(SMALL_FONT, " FPS", (180, 180, 190))
+    fps_x = SCREEN.get_width() - fps_label.get_width() - 10
+    SCREEN.blit(fps_label, (fps_x, 8))
+    FPS_DIGITS.draw(SCREEN, (fps_x - FPS_DIGITS.width(fps), 8), fps)
 
-    pygame.display.flip()
+    present()
 
 
 pygame.quit()